@@ -64,7 +64,13 @@ from .color_utils import (
     color_ramp,
     auto_shades,
     dither_pattern,
+    dither_mask,
+    dither_fill,
     color_distance,
+    color_distance_sq,
+    color_distance_redmean,
+    nearest_color,
+    nearest_colors,
 )
 
 # style.py
@@ -123,7 +129,9 @@ __all__ = [
     "ColorInfo", "extract_palette", "color_count", "opaque_bounds", "pixel_hash",
     # color_utils
     "rgb_to_hsl", "hsl_to_rgb", "lighten", "darken", "saturate", "desaturate",
-    "color_lerp", "color_ramp", "auto_shades", "dither_pattern", "color_distance",
+    "color_lerp", "color_ramp", "auto_shades", "dither_pattern", "dither_mask",
+    "dither_fill", "color_distance", "color_distance_sq", "color_distance_redmean",
+    "nearest_color", "nearest_colors",
     # style
     "GAMEBOY_PALETTE", "NES_PALETTE", "PICO8_PALETTE", "SWEETIE16_PALETTE",
     "ENDESGA32_PALETTE", "get_preset_palette", "list_preset_palettes",
@@ -7,8 +7,17 @@ from collections import Counter
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
 
+try:
+    import numpy as np
+except ImportError:  # optional — pip install pixeldot[perf]
+    np = None
+
 from .color import Color, color_to_hex
-from .sprite import Sprite
+from .sprite import Sprite, _unpack_pixel
+
+
+# Rows per np.unique pass when color_count can stop early
+_COUNT_BAND_ROWS = 16
 
 
 @dataclass
@@ -20,26 +29,55 @@ class ColorInfo:
     percentage: float
 
 
+def _as_rgba_array(sprite: Sprite) -> "np.ndarray":
+    """Return the sprite's pixels as a (H, W, 4) uint8 array."""
+    return np.asarray(sprite.buffer())
+
+
+def _opaque_words(sprite: Sprite) -> List[int]:
+    """Pure-Python counterpart of _opaque_packed: native uint32 words, scan order."""
+    buf = sprite.buffer().cast("B")
+    return [w for w, a in zip(buf.cast("I"), buf[3::4]) if a]
+
+
+def _opaque_packed(sprite: Sprite) -> "np.ndarray":
+    """Return opaque pixels packed as one uint32 per pixel, in scan order."""
+    flat = _as_rgba_array(sprite).reshape(-1, 4)
+    opaque = np.ascontiguousarray(flat[flat[:, 3] > 0])
+    return opaque.view(np.uint32).ravel()
+
+
+def _count_colors(sprite: Sprite) -> Tuple[List[Tuple[Color, int]], int]:
+    """Return ((color, count) pairs ordered like Counter.most_common, total opaque)."""
+    if np is not None:
+        packed = _opaque_packed(sprite)
+        if packed.size == 0:
+            return [], 0
+        values, first, counts = np.unique(
+            packed, return_index=True, return_counts=True
+        )
+        # Most frequent first; ties keep first-seen (scan) order
+        order = np.lexsort((first, -counts))
+        colors = values[order].view(np.uint8).reshape(-1, 4).tolist()
+        pairs = [(tuple(c), n) for c, n in zip(colors, counts[order].tolist())]
+        return pairs, int(packed.size)
+
+    words = _opaque_words(sprite)
+    pairs = [(_unpack_pixel(w), n) for w, n in Counter(words).most_common()]
+    return pairs, len(words)
+
+
 def extract_palette(sprite: Sprite, top_n: int = 12) -> List[ColorInfo]:
     """Extract the most used colors from a sprite.
 
     Transparent pixels are excluded from results.
     """
-    counter: Counter[Color] = Counter()
-    total_opaque = 0
-
-    for y in range(sprite.height):
-        for x in range(sprite.width):
-            c = sprite.get_pixel(x, y)
-            if c[3] > 0:
-                counter[c] += 1
-                total_opaque += 1
-
+    pairs, total_opaque = _count_colors(sprite)
     if total_opaque == 0:
         return []
 
     result: List[ColorInfo] = []
-    for color, count in counter.most_common(top_n):
+    for color, count in pairs[:top_n]:
         result.append(
             ColorInfo(
                 color=color,
@@ -51,15 +89,43 @@ def extract_palette(sprite: Sprite, top_n: int = 12) -> List[ColorInfo]:
     return result
 
 
-def color_count(sprite: Sprite) -> int:
-    """Count unique non-transparent colors in a sprite."""
-    colors: set[Color] = set()
-    for y in range(sprite.height):
-        for x in range(sprite.width):
-            c = sprite.get_pixel(x, y)
-            if c[3] > 0:
-                colors.add(c)
-    return len(colors)
+def color_count(sprite: Sprite, max_count: Optional[int] = None) -> int:
+    """Count unique non-transparent colors in a sprite.
+
+    With ``max_count``, scanning stops as soon as more than ``max_count``
+    colors have been seen and the partial count (> max_count) is returned.
+    Use it to answer "does this fit in N colors?" without a full scan.
+    """
+    if max_count is None:
+        if np is not None:
+            return int(np.unique(_opaque_packed(sprite)).size)
+        return len(set(_opaque_words(sprite)))
+
+    w = sprite.width
+    if np is not None:
+        packed = _as_rgba_array(sprite).reshape(-1, 4)
+        alpha = packed[:, 3]
+        words = np.ascontiguousarray(packed).view(np.uint32).ravel()
+        seen = np.empty(0, dtype=np.uint32)
+        step = _COUNT_BAND_ROWS * w
+        for start in range(0, words.size, step):
+            band = words[start : start + step][alpha[start : start + step] > 0]
+            seen = np.union1d(seen, band)
+            if seen.size > max_count:
+                break
+        return int(seen.size)
+
+    buf = sprite.buffer().cast("B")
+    words = buf.cast("I")
+    alpha = buf[3::4]
+    seen: set[int] = set()
+    for start in range(0, len(words), w):
+        seen.update(
+            c for c, a in zip(words[start : start + w], alpha[start : start + w]) if a
+        )
+        if len(seen) > max_count:
+            break
+    return len(seen)
 
 
 def opaque_bounds(sprite: Sprite) -> Optional[Tuple[int, int, int, int]]:
@@ -69,9 +135,4 @@ def opaque_bounds(sprite: Sprite) -> Optional[Tuple[int, int, int, int]]:
 
 def pixel_hash(sprite: Sprite) -> str:
     """Compute SHA-256 hash of pixel data for uniqueness checking."""
-    h = hashlib.sha256()
-    for y in range(sprite.height):
-        for x in range(sprite.width):
-            c = sprite.get_pixel(x, y)
-            h.update(bytes(c))
-    return h.hexdigest()
+    return hashlib.sha256(sprite.buffer()).hexdigest()
@@ -5,9 +5,16 @@ from __future__ import annotations
 import textwrap
 from typing import List, Optional
 
-from .color import Color, Palette
+try:
+    import numpy as np
+except ImportError:  # optional — pip install pixeldot[perf]
+    np = None
+
+from .color import Palette, _reverse_text
 from .sprite import Sprite
 
+_MISSING = object()
+
 
 class StringCanvas:
     """Renders single-character-per-pixel string art into Sprites.
@@ -49,33 +56,65 @@ class StringCanvas:
             raise ValueError("All rows are empty")
 
         width = len(rows[0])
-        for i, row in enumerate(rows):
-            if len(row) != width:
-                raise ValueError(
-                    f"Row {i} has {len(row)} chars, expected {width} "
-                    f"(row: {row!r})"
-                )
-
-        pixels: list[list[Color]] = []
-        for y, row in enumerate(rows):
-            pixel_row: list[Color] = []
-            for x, ch in enumerate(row):
-                if ch not in self._palette:
-                    raise KeyError(
-                        f"Character {ch!r} at ({x}, {y}) not in palette"
+        if len(set(map(len, rows))) != 1:
+            for i, row in enumerate(rows):
+                if len(row) != width:
+                    raise ValueError(
+                        f"Row {i} has {len(row)} chars, expected {width} "
+                        f"(row: {row!r})"
                     )
-                pixel_row.append(self._palette[ch])
-            pixels.append(pixel_row)
 
-        return Sprite(pixels, _skip_copy=True)
+        lut = self._palette._byte_lut()
+        if lut is not None:
+            try:
+                data = "".join(rows).encode("latin-1")
+            except UnicodeEncodeError:
+                pass  # not a palette key; the scalar path reports it
+            else:
+                return self._render_lut(rows, data, width, lut)
+
+        # Translate every key to its 4 RGBA bytes in one C pass. Unknown
+        # characters pass through unchanged, which shows up as a length
+        # mismatch (or an encode error), and are then located for the message.
+        text = "".join(rows)
+        try:
+            data = text.translate(self._palette._translate_table()).encode("latin-1")
+        except UnicodeEncodeError:
+            data = b""
+        if len(data) == 4 * len(text):
+            return Sprite._from_bytes(data, width, len(rows))
+
+        get = self._palette._get
+        y, x = next(
+            (y, x)
+            for y, row in enumerate(rows)
+            for x, ch in enumerate(row)
+            if get(ch, _MISSING) is _MISSING
+        )
+        raise KeyError(f"Character {rows[y][x]!r} at ({x}, {y}) not in palette")
+
+    @staticmethod
+    def _render_lut(rows: List[str], data: bytes, width: int, lut) -> Sprite:
+        """Vectorized render: gather every pixel through the palette byte LUT."""
+        colors, valid = lut
+        idx = np.frombuffer(data, dtype=np.uint8)
+        ok = valid[idx]
+        if not ok.all():
+            y, x = divmod(int(np.argmin(ok)), width)
+            raise KeyError(
+                f"Character {rows[y][x]!r} at ({x}, {y}) not in palette"
+            )
+        return Sprite._from_bytes(colors[idx].tobytes(), width, len(rows))
 
     def render_block(self, block: str) -> Sprite:
         """Render a triple-quoted block string.
 
         Automatically handles dedent and strips leading/trailing blank lines.
         """
-        text = textwrap.dedent(block)
-        lines = text.split("\n")
+        lines = block.split("\n")
+        # dedent is a no-op (but still a full regex scan) for flush-left blocks
+        if any(ln[:1] in (" ", "\t") for ln in lines if ln):
+            lines = textwrap.dedent(block).split("\n")
         # Strip leading and trailing empty lines
         while lines and not lines[0].strip():
             lines.pop(0)
@@ -92,16 +131,27 @@ class StringCanvas:
         Useful for editing existing PNGs in string format.
         Raises KeyError if a pixel color has no palette entry.
         """
+        rev = palette._reverse_table()
+        if rev is not None:
+            words = np.asarray(sprite.buffer()).view(np.uint32).ravel()
+            text = _reverse_text(rev, words)
+            if text is not None:
+                w = sprite.width
+                return [text[i : i + w] for i in range(0, len(text), w)]
+
+        # Match whole pixels as native uint32 words against a packed inverse map
+        lookup = palette._word_lookup()
+        px = memoryview(sprite.buffer()).cast("B").cast("I")
+        w = sprite.width
         rows: List[str] = []
         for y in range(sprite.height):
-            chars: list[str] = []
-            for x in range(sprite.width):
+            row = px[y * w : (y + 1) * w]
+            try:
+                rows.append("".join([lookup[c] for c in row]))
+            except KeyError:
+                x = next(i for i, c in enumerate(row) if c not in lookup)
                 color = sprite.get_pixel(x, y)
-                ch = palette.reverse_lookup(color)
-                if ch is None:
-                    raise KeyError(
-                        f"Color {color} at ({x}, {y}) has no palette entry"
-                    )
-                chars.append(ch)
-            rows.append("".join(chars))
+                raise KeyError(
+                    f"Color {color} at ({x}, {y}) has no palette entry"
+                ) from None
         return rows
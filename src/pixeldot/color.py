@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
+import sys
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
 
+try:
+    import numpy as np
+except ImportError:  # optional — pip install pixeldot[perf]
+    np = None
+
 Color = Tuple[int, int, int, int]  # RGBA
 
 TRANSPARENT: Color = (0, 0, 0, 0)
@@ -16,33 +23,90 @@ def rgba(r: int, g: int, b: int, a: int = 255) -> Color:
     return (r, g, b, a)
 
 
+@lru_cache(maxsize=512)
 def hex_to_color(hex_str: str) -> Color:
     """Convert hex string to RGBA color.
 
     Supports: "#RGB", "#RGBA", "#RRGGBB", "#RRGGBBAA" (with or without #).
+    Results are cached, so repeated palette construction parses each string once.
     """
     h = hex_str.lstrip("#")
-    if len(h) == 3:
-        r, g, b = (int(c * 2, 16) for c in h)
-        return (r, g, b, 255)
-    if len(h) == 4:
-        r, g, b, a = (int(c * 2, 16) for c in h)
-        return (r, g, b, a)
-    if len(h) == 6:
-        return (int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16), 255)
-    if len(h) == 8:
-        return (int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16), int(h[6:8], 16))
+    n = len(h)
+    if n == 3 or n == 4:
+        h = "".join(c * 2 for c in h)
+    elif n != 6 and n != 8:
+        raise ValueError(f"Invalid hex color: {hex_str!r}")
+    try:
+        b = bytes.fromhex(h)
+    except ValueError:
+        b = b""
+    # fromhex skips embedded whitespace, so a short result means bad input
+    if len(b) * 2 == len(h):
+        return (b[0], b[1], b[2], b[3] if len(b) == 4 else 255)
     raise ValueError(f"Invalid hex color: {hex_str!r}")
 
 
 def color_to_hex(color: Color) -> str:
     """Convert RGBA color to hex string (e.g. '#FF8800' or '#FF880080')."""
+    return _color_to_hex(tuple(color))
+
+
+@lru_cache(maxsize=1024)
+def _color_to_hex(color: Color) -> str:
     r, g, b, a = color
     if a == 255:
         return f"#{r:02X}{g:02X}{b:02X}"
     return f"#{r:02X}{g:02X}{b:02X}{a:02X}"
 
 
+def _reverse_table(reverse: Dict[Color, str], key_length: int):
+    """Exact vectorized inverse of a color -> key map, or None.
+
+    Returns (sorted uint32 pixel words, their keys) for matching whole pixels
+    with searchsorted, or None if NumPy is unavailable or no color in the map
+    fits in a pixel word.
+    """
+    if np is None:
+        return None
+    lookup = _word_lookup(reverse)
+    if not lookup:
+        return None
+    words = np.fromiter(lookup, dtype=np.uint32, count=len(lookup))
+    keys = np.array(list(lookup.values()), dtype=f"<U{key_length}")
+    order = np.argsort(words)
+    return words[order], keys[order]
+
+
+def _reverse_text(rev, words: "np.ndarray") -> Optional[str]:
+    """Map uint32 pixel words to their concatenated keys via _reverse_table.
+
+    Returns None if any pixel has no key; callers locate it for the message.
+    """
+    known, keys = rev
+    colors, inverse = np.unique(words, return_inverse=True)
+    idx = np.minimum(np.searchsorted(known, colors), known.size - 1)
+    if not np.array_equal(known[idx], colors):
+        return None
+    return keys[idx][inverse.ravel()].tobytes().decode("utf-32-le")
+
+
+def _word_lookup(reverse: Dict[Color, str]) -> Dict[int, str]:
+    """Re-key a color -> key map by each color's native uint32 pixel word.
+
+    Colors that do not fit in a pixel word (channels outside 0..255) are
+    skipped; no Sprite pixel can equal them.
+    """
+    lookup: Dict[int, str] = {}
+    for color, key in reverse.items():
+        try:
+            packed = bytes(color)
+        except (TypeError, ValueError):
+            continue
+        if len(packed) == 4:
+            lookup[int.from_bytes(packed, sys.byteorder)] = key
+    return lookup
+
+
 class Palette:
     """Single-character to RGBA color mapping.
 
@@ -60,7 +124,16 @@ class Palette:
             if isinstance(value, str):
                 self._map[key] = hex_to_color(value)
             else:
-                self._map[key] = value
+                self._map[key] = tuple(value)
+        # Inverse map for reverse_lookup; the first key wins for duplicate colors
+        self._reverse: Dict[Color, str] = {}
+        for key, color in self._map.items():
+            self._reverse.setdefault(color, key)
+        self._lut: Optional[Tuple["np.ndarray", "np.ndarray"]] = None
+        self._get = self._map.get
+        self._trans: Optional[Dict[int, str]] = None
+        self._rev: object = None  # _reverse_table result, False if unavailable
+        self._words: Optional[Dict[int, str]] = None
 
     def __getitem__(self, key: str) -> Color:
         try:
@@ -83,6 +156,49 @@ class Palette:
     def items(self):
         return self._map.items()
 
+    def _byte_lut(self) -> Optional[Tuple["np.ndarray", "np.ndarray"]]:
+        """Return (colors, valid) 256-entry tables indexed by latin-1 byte value.
+
+        ``colors`` holds the RGBA bytes for each key and ``valid`` marks which
+        bytes are palette keys. Returns None if NumPy is unavailable or a key
+        falls outside latin-1. Built lazily and cached.
+        """
+        if self._lut is None:
+            if np is None or any(ord(key) > 0xFF for key in self._map):
+                return None
+            colors = np.zeros((256, 4), dtype=np.uint8)
+            valid = np.zeros(256, dtype=bool)
+            for key, color in self._map.items():
+                colors[ord(key)] = color
+                valid[ord(key)] = True
+            self._lut = (colors, valid)
+        return self._lut
+
+    def _translate_table(self) -> Dict[int, str]:
+        """Return a str.translate table mapping each key to its 4 RGBA bytes.
+
+        Values are latin-1 strings, so ``row.translate(t).encode("latin-1")``
+        yields the row's pixel bytes in one C pass. Built lazily and cached.
+        """
+        if self._trans is None:
+            self._trans = {
+                ord(key): bytes(color).decode("latin-1")
+                for key, color in self._map.items()
+            }
+        return self._trans
+
+    def _reverse_table(self):
+        """Cached _reverse_table for this palette's inverse map, or None."""
+        if self._rev is None:
+            self._rev = _reverse_table(self._reverse, 1) or False
+        return self._rev or None
+
+    def _word_lookup(self) -> Dict[int, str]:
+        """Inverse map keyed by each color's native uint32 pixel word. Cached."""
+        if self._words is None:
+            self._words = _word_lookup(self._reverse)
+        return self._words
+
     def with_updates(self, **overrides: Color | str) -> Palette:
         """Return a new Palette with the given overrides applied."""
         new_map: Dict[str, Color | str] = dict(self._map)
@@ -91,7 +207,4 @@ class Palette:
 
     def reverse_lookup(self, color: Color) -> Optional[str]:
         """Find the character key for a given color. Returns None if not found."""
-        for key, val in self._map.items():
-            if val == color:
-                return key
-        return None
+        return self._reverse.get(color)
@@ -3,18 +3,53 @@
 from __future__ import annotations
 
 import math
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional — pip install pixeldot[perf]
+    np = None
 
 from .color import Color
+from .sprite import Sprite
+
+
+# Fully saturated primaries/secondaries, exact to what the general path computes
+_PRIMARY_HSL: Dict[Tuple[int, int, int], Tuple[float, float, float]] = {
+    (255, 0, 0): (0.0, 1.0, 0.5),
+    (255, 255, 0): (60.0, 1.0, 0.5),
+    (0, 255, 0): (120.0, 1.0, 0.5),
+    (0, 255, 255): (180.0, 1.0, 0.5),
+    (0, 0, 255): (240.0, 1.0, 0.5),
+    (255, 0, 255): (300.0, 1.0, 0.5),
+}
 
 
 def rgb_to_hsl(color: Color) -> Tuple[float, float, float]:
-    """Convert RGBA color to HSL. Returns (h, s, l) with h in [0,360), s,l in [0,1]."""
+    """Convert RGBA color to HSL. Returns (h, s, l) with h in [0,360), s,l in [0,1].
+
+    Results are cached per color.
+    """
+    return _rgb_to_hsl(tuple(color))
+
+
+@lru_cache(maxsize=2048)
+def _rgb_to_hsl(color: Color) -> Tuple[float, float, float]:
     r, g, b, _a = color
+    if r == g == b:
+        return (0.0, 0.0, r / 255.0)
+    hit = _PRIMARY_HSL.get((r, g, b))
+    if hit is not None:
+        return hit
+    # Pick the extreme channels on the ints; builtin max()/min() calls cost
+    # more than the rest of the conversion
+    mx = r if r >= g and r >= b else (g if g >= b else b)
+    mn = r if r <= g and r <= b else (g if g <= b else b)
     rf, gf, bf = r / 255.0, g / 255.0, b / 255.0
 
-    cmax = max(rf, gf, bf)
-    cmin = min(rf, gf, bf)
+    cmax = mx / 255.0
+    cmin = mn / 255.0
     delta = cmax - cmin
 
     # Lightness
@@ -27,45 +62,65 @@ def rgb_to_hsl(color: Color) -> Tuple[float, float, float]:
     s = delta / (1.0 - abs(2.0 * l - 1.0))
 
     # Hue
-    if cmax == rf:
+    if mx == r:
         h = 60.0 * (((gf - bf) / delta) % 6)
-    elif cmax == gf:
+    elif mx == g:
         h = 60.0 * (((bf - rf) / delta) + 2)
     else:
         h = 60.0 * (((rf - gf) / delta) + 4)
 
-    return (h % 360.0, min(s, 1.0), l)
+    return (h % 360.0, s if s < 1.0 else 1.0, l)
 
 
 def hsl_to_rgb(h: float, s: float, l: float, a: int = 255) -> Color:
     """Convert HSL to RGBA color. h in [0,360), s,l in [0,1], a in [0,255]."""
     h = h % 360.0
-    s = max(0.0, min(1.0, s))
-    l = max(0.0, min(1.0, l))
+    s = 0.0 if s < 0.0 else (s if s < 1.0 else 1.0)
+    l = 0.0 if l < 0.0 else (l if l < 1.0 else 1.0)
 
     c = (1.0 - abs(2.0 * l - 1.0)) * s
-    x = c * (1.0 - abs((h / 60.0) % 2 - 1.0))
+    hp = h / 60.0
+    x = c * (1.0 - abs(hp % 2 - 1.0))
     m = l - c / 2.0
 
-    if h < 60:
+    # Sector k covers hues [60k, 60k + 60); hp < 6 after the wrap above
+    k = int(hp)
+    if k == 0:
         rf, gf, bf = c, x, 0.0
-    elif h < 120:
+    elif k == 1:
         rf, gf, bf = x, c, 0.0
-    elif h < 180:
+    elif k == 2:
         rf, gf, bf = 0.0, c, x
-    elif h < 240:
+    elif k == 3:
         rf, gf, bf = 0.0, x, c
-    elif h < 300:
+    elif k == 4:
         rf, gf, bf = x, 0.0, c
     else:
         rf, gf, bf = c, 0.0, x
 
-    return (
-        _clamp(round((rf + m) * 255)),
-        _clamp(round((gf + m) * 255)),
-        _clamp(round((bf + m) * 255)),
-        a,
-    )
+    # With s and l clamped, every channel lies in [0, 1] up to rounding
+    # error, so the rounded bytes need no further clamping
+    return (round((rf + m) * 255), round((gf + m) * 255), round((bf + m) * 255), a)
+
+
+def _hsl_to_rgb_array(h: "np.ndarray", s: "np.ndarray", l: "np.ndarray") -> "np.ndarray":
+    """Vectorized hsl_to_rgb over float arrays. Returns an (N, 3) int array."""
+    h = np.mod(h, 360.0)
+    s = np.clip(s, 0.0, 1.0)
+    l = np.clip(l, 0.0, 1.0)
+
+    c = (1.0 - np.abs(2.0 * l - 1.0)) * s
+    x = c * (1.0 - np.abs(np.mod(h / 60.0, 2) - 1.0))
+    m = l - c / 2.0
+    zero = np.zeros_like(c)
+
+    sectors = [h < 60, h < 120, h < 180, h < 240, h < 300]
+    rf = np.select(sectors, [c, x, zero, zero, x], default=c)
+    gf = np.select(sectors, [x, c, c, x, zero], default=zero)
+    bf = np.select(sectors, [zero, zero, x, c, c], default=x)
+
+    rgb = np.stack([rf, gf, bf], axis=-1) + m[..., None]
+    return np.clip(np.rint(rgb * 255), 0, 255).astype(np.int64)
 
 
 def lighten(color: Color, amount: float = 0.2) -> Color:
@@ -107,7 +162,13 @@ def color_ramp(start: Color, end: Color, steps: int) -> List[Color]:
     """Generate a gradient of colors from start to end (inclusive)."""
     if steps < 2:
         raise ValueError("color_ramp requires at least 2 steps")
-    return [color_lerp(start, end, i / (steps - 1)) for i in range(steps)]
+    if np is None:
+        return [color_lerp(start, end, i / (steps - 1)) for i in range(steps)]
+    t = (np.arange(steps) / (steps - 1))[:, None]
+    c1 = np.array(start, dtype=np.float64)
+    c2 = np.array(end, dtype=np.float64)
+    rgba = np.clip(np.rint(c1 + (c2 - c1) * t), 0, 255).astype(np.int64)
+    return [tuple(c) for c in rgba.tolist()]
 
 
 def auto_shades(base_color: Color, count: int = 5) -> List[Color]:
@@ -118,10 +179,23 @@ def auto_shades(base_color: Color, count: int = 5) -> List[Color]:
     # Range from highlight (high lightness) to shadow (low lightness)
     l_high = min(1.0, l + 0.3)
     l_low = max(0.0, l - 0.3)
-    return [
-        hsl_to_rgb(h, s, l_high + (l_low - l_high) * i / (count - 1), base_color[3])
-        for i in range(count)
-    ]
+    if np is None:
+        return [
+            hsl_to_rgb(h, s, l_high + (l_low - l_high) * i / (count - 1), base_color[3])
+            for i in range(count)
+        ]
+    ls = l_high + (l_low - l_high) * np.arange(count) / (count - 1)
+    rgb = _hsl_to_rgb_array(np.full(count, h), np.full(count, s), ls)
+    a = base_color[3]
+    return [(r, g, b, a) for r, g, b in rgb.tolist()]
+
+
+# True = c1, False = c2
+_DITHER_PATTERNS = {
+    "checker": ((True, False), (False, True)),
+    "horizontal": ((True, True), (False, False)),
+    "vertical": ((True, False), (True, False)),
+}
 
 
 def dither_pattern(c1: Color, c2: Color, pattern: str = "checker") -> List[List[bool]]:
@@ -129,32 +203,135 @@ def dither_pattern(c1: Color, c2: Color, pattern: str = "checker") -> List[List[
 
     True = c1, False = c2. Supported patterns: 'checker', 'horizontal', 'vertical'.
     """
-    if pattern == "checker":
-        return [
-            [True, False],
-            [False, True],
-        ]
-    if pattern == "horizontal":
-        return [
-            [True, True],
-            [False, False],
-        ]
-    if pattern == "vertical":
-        return [
-            [True, False],
-            [True, False],
-        ]
-    raise ValueError(f"Unknown dither pattern: {pattern!r}")
+    try:
+        rows = _DITHER_PATTERNS[pattern]
+    except KeyError:
+        raise ValueError(f"Unknown dither pattern: {pattern!r}")
+    return [list(row) for row in rows]
+
+
+@lru_cache(maxsize=None)
+def dither_mask(pattern: str = "checker") -> "np.ndarray":
+    """Return a dither pattern as a cached, read-only uint8 mask (1 = c1, 0 = c2).
+
+    Broadcasts directly against (H, W, 4) pixel arrays. Requires NumPy.
+    """
+    if np is None:
+        raise ImportError(
+            "dither_mask requires NumPy. Install it with: pip install pixeldot[perf]"
+        )
+    try:
+        rows = _DITHER_PATTERNS[pattern]
+    except KeyError:
+        raise ValueError(f"Unknown dither pattern: {pattern!r}")
+    mask = np.array(rows, dtype=np.uint8)
+    mask.flags.writeable = False
+    return mask
+
+
+def dither_fill(
+    width: int, height: int, c1: Color, c2: Color, pattern: str = "checker"
+) -> Sprite:
+    """Return a width x height Sprite tiled with a dither pattern of c1 and c2."""
+    try:
+        rows = _DITHER_PATTERNS[pattern]
+    except KeyError:
+        raise ValueError(f"Unknown dither pattern: {pattern!r}")
+    if width < 1 or height < 1:
+        raise ValueError("Sprite must have at least 1x1 pixels")
+    a, b = bytes(c1), bytes(c2)
+    # Tile at the byte level: one pattern row repeated across, rows cycled down
+    tiles = []
+    for row in rows:
+        unit = b"".join(a if v else b for v in row)
+        tiles.append((unit * -(-width // len(row)))[: width * 4])
+    data = b"".join(tiles[y % len(tiles)] for y in range(height))
+    return Sprite._from_bytes(data, width, height)
 
 
 def color_distance(c1: Color, c2: Color) -> float:
     """Euclidean distance between two colors in RGBA space."""
+    return math.sqrt(color_distance_sq(c1, c2))
+
+
+def color_distance_sq(c1: Color, c2: Color) -> int:
+    """Squared Euclidean distance in RGBA space.
+
+    Ranks colors the same way as color_distance without the square root,
+    so prefer it when only comparing distances.
+    """
+    dr = c1[0] - c2[0]
+    dg = c1[1] - c2[1]
+    db = c1[2] - c2[2]
+    da = c1[3] - c2[3]
+    return dr * dr + dg * dg + db * db + da * da
+
+
+def color_distance_redmean(c1: Color, c2: Color) -> float:
+    """Perceptually weighted RGB distance ("redmean" approximation).
+
+    Weights each channel by the mean red level, which tracks human color
+    difference far better than plain Euclidean RGB at the same cost. Alpha
+    is ignored.
+    """
+    r_bar = (c1[0] + c2[0]) / 2
+    dr = c1[0] - c2[0]
+    dg = c1[1] - c2[1]
+    db = c1[2] - c2[2]
     return math.sqrt(
-        (c1[0] - c2[0]) ** 2
-        + (c1[1] - c2[1]) ** 2
-        + (c1[2] - c2[2]) ** 2
-        + (c1[3] - c2[3]) ** 2
+        (2 + r_bar / 256) * dr * dr
+        + 4 * dg * dg
+        + (2 + (255 - r_bar) / 256) * db * db
+    )
+
+
+def nearest_color(target: Color, colors: Sequence[Color]) -> Color:
+    """Return the color in colors closest to target. Ties go to the earliest."""
+    if not colors:
+        raise ValueError("nearest_color requires at least 1 candidate color")
+    if np is None:
+        return min(colors, key=lambda c: color_distance_sq(target, c))
+    arr = np.asarray(colors, dtype=np.int32)
+    diff = arr - np.asarray(target, dtype=np.int32)
+    d = np.einsum("ij,ij->i", diff, diff)
+    return tuple(arr[int(d.argmin())].tolist())
+
+
+# Unique targets per distance-matrix block in nearest_colors (bounds memory)
+_NEAREST_BLOCK = 4096
+
+
+def nearest_colors(targets: Sequence[Color], colors: Sequence[Color]) -> List[Color]:
+    """nearest_color for many targets at once, e.g. every pixel of a sprite.
+
+    Each distinct target is solved once and the answer reused for repeats,
+    so cost scales with the number of unique colors, not pixels.
+    """
+    if not colors:
+        raise ValueError("nearest_colors requires at least 1 candidate color")
+    if not targets:
+        return []
+    if np is None:
+        memo: Dict[Color, Color] = {}
+        out: List[Color] = []
+        for t in targets:
+            hit = memo.get(t)
+            if hit is None:
+                hit = memo[t] = nearest_color(t, colors)
+            out.append(hit)
+        return out
+    cand = np.asarray(colors, dtype=np.int32)
+    uniq, inverse = np.unique(
+        np.asarray(targets, dtype=np.int32), axis=0, return_inverse=True
     )
+    best = np.empty(len(uniq), dtype=np.intp)
+    for i in range(0, len(uniq), _NEAREST_BLOCK):
+        diff = uniq[i : i + _NEAREST_BLOCK, None, :] - cand[None, :, :]
+        d = np.einsum("ijk,ijk->ij", diff, diff)
+        # argmin returns the first minimum, so ties go to the earliest color
+        best[i : i + _NEAREST_BLOCK] = d.argmin(axis=1)
+    picked = [tuple(c) for c in cand[best].tolist()]
+    return [picked[i] for i in inverse.ravel().tolist()]
 
 
 def _clamp(v: int) -> int:
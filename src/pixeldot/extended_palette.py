@@ -5,10 +5,18 @@ from __future__ import annotations
 import string
 import textwrap
 from collections import Counter
-from typing import Dict, List, Optional, Tuple, Union
+from itertools import product
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
-from .color import Color, Palette, hex_to_color
-from .sprite import Sprite
+try:
+    import numpy as np
+except ImportError:  # optional — pip install pixeldot[perf]
+    np = None
+
+from .color import (
+    Color, Palette, _reverse_table, _reverse_text, _word_lookup, hex_to_color,
+)
+from .sprite import Sprite, _unpack_pixel
 
 
 class MultiCharPalette:
@@ -25,7 +33,14 @@ class MultiCharPalette:
             if isinstance(value, str):
                 self._map[key] = hex_to_color(value)
             else:
-                self._map[key] = value
+                self._map[key] = tuple(value)
+        # Inverse map for reverse_lookup; the first key wins for duplicate colors
+        self._reverse: Dict[Color, str] = {}
+        for key, color in self._map.items():
+            self._reverse.setdefault(color, key)
+        self._lut: Optional[Tuple["np.ndarray", "np.ndarray"]] = None
+        self._rev: object = None  # _reverse_table result, False if unavailable
+        self._words: Optional[Dict[int, str]] = None
 
     @property
     def key_length(self) -> int:
@@ -54,10 +69,55 @@ class MultiCharPalette:
 
     def reverse_lookup(self, color: Color) -> Optional[str]:
         """Find the key for a given color. Returns None if not found."""
-        for key, val in self._map.items():
-            if val == color:
-                return key
-        return None
+        return self._reverse.get(color)
+
+    def _byte_lut(self) -> Optional[Tuple["np.ndarray", "np.ndarray"]]:
+        """Return dense (colors, valid) tables indexed by a key's packed bytes.
+
+        Only built for key_length 1 or 2 (256 or 65536 entries) with latin-1
+        keys; returns None otherwise or if NumPy is unavailable. Cached.
+        """
+        if self._lut is None:
+            kl = self._key_length
+            if np is None or kl > 2:
+                return None
+            try:
+                packed = [
+                    int.from_bytes(key.encode("latin-1"), "big") for key in self._map
+                ]
+            except UnicodeEncodeError:
+                return None
+            colors = np.zeros((256 ** kl, 4), dtype=np.uint8)
+            valid = np.zeros(256 ** kl, dtype=bool)
+            for code, color in zip(packed, self._map.values()):
+                colors[code] = color
+            valid[packed] = True
+            self._lut = (colors, valid)
+        return self._lut
+
+    def _reverse_table(self):
+        """Cached _reverse_table for this palette's inverse map, or None."""
+        if self._rev is None:
+            self._rev = _reverse_table(self._reverse, self._key_length) or False
+        return self._rev or None
+
+    def _render_lut(
+        self, rows: List[str], data: bytes, pixel_width: int, lut
+    ) -> Sprite:
+        """Vectorized render: pack each key's bytes and gather through the LUT."""
+        colors, valid = lut
+        kl = self._key_length
+        codes = np.frombuffer(data, dtype=np.uint8).reshape(-1, kl)
+        if kl == 2:
+            idx = (codes[:, 0].astype(np.uint16) << 8) | codes[:, 1]
+        else:
+            idx = codes[:, 0]
+        ok = valid[idx]
+        if not ok.all():
+            y, x = divmod(int(np.argmin(ok)), pixel_width)
+            key = rows[y][x * kl : (x + 1) * kl]
+            raise KeyError(f"Key {key!r} at pixel ({x}, {y}) not in palette")
+        return Sprite._from_bytes(colors[idx].tobytes(), pixel_width, len(rows))
 
     def render(self, rows: List[str]) -> Sprite:
         """Render rows where every key_length chars map to one pixel."""
@@ -75,11 +135,21 @@ class MultiCharPalette:
             )
         pixel_width = width // kl
 
-        for i, row in enumerate(rows):
-            if len(row) != width:
-                raise ValueError(
-                    f"Row {i} has {len(row)} chars, expected {width}"
-                )
+        if len(set(map(len, rows))) != 1:
+            for i, row in enumerate(rows):
+                if len(row) != width:
+                    raise ValueError(
+                        f"Row {i} has {len(row)} chars, expected {width}"
+                    )
+
+        lut = self._byte_lut()
+        if lut is not None:
+            try:
+                data = "".join(rows).encode("latin-1")
+            except UnicodeEncodeError:
+                pass  # not a palette key; the scalar path reports it
+            else:
+                return self._render_lut(rows, data, pixel_width, lut)
 
         pixels: list[list[Color]] = []
         for y, row in enumerate(rows):
@@ -93,7 +163,7 @@ class MultiCharPalette:
                 pixel_row.append(self._map[key])
             pixels.append(pixel_row)
 
-        return Sprite(pixels, _skip_copy=True)
+        return Sprite(pixels)
 
     def render_block(self, block: str) -> Sprite:
         """Like StringCanvas.render_block but with multi-char keys."""
@@ -109,23 +179,75 @@ class MultiCharPalette:
 
     def to_string(self, sprite: Sprite) -> List[str]:
         """Reverse render: convert Sprite back to string rows."""
-        rows: List[str] = []
-        for y in range(sprite.height):
-            keys: list[str] = []
-            for x in range(sprite.width):
-                color = sprite.get_pixel(x, y)
-                key = self.reverse_lookup(color)
-                if key is None:
-                    raise KeyError(
-                        f"Color {color} at ({x}, {y}) has no palette entry"
-                    )
-                keys.append(key)
-            rows.append("".join(keys))
-        return rows
+        rw = sprite.width * self._key_length
+        rev = self._reverse_table()
+        if rev is not None:
+            words = np.asarray(sprite.buffer()).view(np.uint32).ravel()
+            text = _reverse_text(rev, words)
+            if text is not None:
+                return [text[i : i + rw] for i in range(0, len(text), rw)]
+
+        if self._words is None:
+            self._words = _word_lookup(self._reverse)
+        lookup = self._words
+        words = sprite.buffer().cast("B").cast("I")
+        # Build the whole raster as one string, then slice it into rows
+        try:
+            text = "".join([lookup[c] for c in words])
+        except KeyError:
+            i = next(i for i, c in enumerate(words) if c not in lookup)
+            y, x = divmod(i, sprite.width)
+            color = sprite.get_pixel(x, y)
+            raise KeyError(
+                f"Color {color} at ({x}, {y}) has no palette entry"
+            ) from None
+        return [text[i : i + rw] for i in range(0, len(text), rw)]
 
 
 # Characters available for auto-assignment (a-z, A-Z, 0-9)
 _SINGLE_CHARS = list(string.ascii_lowercase + string.ascii_uppercase + string.digits)
+# 2-char keys in assignment order: aa, ab, ..., a9, ba, ... (3844 keys)
+_DOUBLE_CHARS = [a + b for a, b in product(_SINGLE_CHARS, repeat=2)]
+
+
+def _rank_colors(sprite: Sprite):
+    """Return (colors by descending frequency, per-pixel rank in that list).
+
+    Ties keep first-seen (scan) order, matching Counter.most_common.
+    """
+    if np is not None:
+        words = np.asarray(sprite.buffer()).view(np.uint32).ravel()
+        values, first, inverse, counts = np.unique(
+            words, return_index=True, return_inverse=True, return_counts=True
+        )
+        order = np.lexsort((first, -counts))
+        rank = np.empty_like(order)
+        rank[order] = np.arange(order.size)
+        colors = [tuple(c) for c in values[order].view(np.uint8).reshape(-1, 4).tolist()]
+        return colors, rank[inverse.ravel()]
+
+    words = sprite.buffer().cast("B").cast("I")
+    by_freq = [w for w, _ in Counter(words).most_common()]
+    index = {w: i for i, w in enumerate(by_freq)}
+    return [_unpack_pixel(w) for w in by_freq], [index[w] for w in words]
+
+
+def _key_rows(sprite: Sprite, keys: Sequence[str], ranks) -> List[str]:
+    """Turn per-pixel ranks from _rank_colors into string rows of keys.
+
+    All keys must be ASCII and of equal length.
+    """
+    w = sprite.width
+    if np is not None:
+        # Gather each pixel's key bytes, then decode the whole grid at once
+        codes = np.frombuffer("".join(keys).encode("ascii"), dtype=np.uint8)
+        text = codes.reshape(len(keys), -1)[ranks].tobytes().decode("ascii")
+        rw = w * len(keys[0])
+        return [text[i : i + rw] for i in range(0, len(text), rw)]
+    return [
+        "".join([keys[r] for r in ranks[y * w : (y + 1) * w]])
+        for y in range(sprite.height)
+    ]
 
 
 class AutoPalette:
@@ -141,56 +263,23 @@ class AutoPalette:
         If there are more unique colors than max_single_char, returns
         a MultiCharPalette with 2-char keys.
         """
-        # Count color frequencies
-        counter: Counter[Color] = Counter()
-        for y in range(sprite.height):
-            for x in range(sprite.width):
-                counter[sprite.get_pixel(x, y)] += 1
-
-        colors_by_freq = [c for c, _ in counter.most_common()]
+        colors_by_freq, ranks = _rank_colors(sprite)
 
         if len(colors_by_freq) <= min(max_single_char, len(_SINGLE_CHARS)):
             # Use single-char palette
-            mapping: Dict[str, Color] = {}
-            color_to_key: Dict[Color, str] = {}
-            for i, color in enumerate(colors_by_freq):
-                key = _SINGLE_CHARS[i]
-                mapping[key] = color
-                color_to_key[color] = key
-            palette = Palette(mapping)
-            rows: List[str] = []
-            for y in range(sprite.height):
-                chars: list[str] = []
-                for x in range(sprite.width):
-                    chars.append(color_to_key[sprite.get_pixel(x, y)])
-                rows.append("".join(chars))
-            return palette, rows
+            keys = _SINGLE_CHARS[: len(colors_by_freq)]
+            palette = Palette(dict(zip(keys, colors_by_freq)))
+            return palette, _key_rows(sprite, keys, ranks)
         else:
             # Use 2-char palette
-            two_chars = _SINGLE_CHARS
-            keys_2: list[str] = []
-            for a in two_chars:
-                for b in two_chars:
-                    keys_2.append(a + b)
-                    if len(keys_2) >= len(colors_by_freq):
-                        break
-                if len(keys_2) >= len(colors_by_freq):
-                    break
-
-            mapping_2: Dict[str, Color] = {}
-            color_to_key_2: Dict[Color, str] = {}
-            for i, color in enumerate(colors_by_freq):
-                key = keys_2[i]
-                mapping_2[key] = color
-                color_to_key_2[color] = key
-            mcp = MultiCharPalette(mapping_2, key_length=2)
-            rows_2: List[str] = []
-            for y in range(sprite.height):
-                keys: list[str] = []
-                for x in range(sprite.width):
-                    keys.append(color_to_key_2[sprite.get_pixel(x, y)])
-                rows_2.append("".join(keys))
-            return mcp, rows_2
+            if len(colors_by_freq) > len(_DOUBLE_CHARS):
+                raise ValueError(
+                    f"Sprite has {len(colors_by_freq)} colors; at most "
+                    f"{len(_DOUBLE_CHARS)} fit in 2-char keys"
+                )
+            keys_2 = _DOUBLE_CHARS[: len(colors_by_freq)]
+            mcp = MultiCharPalette(dict(zip(keys_2, colors_by_freq)), key_length=2)
+            return mcp, _key_rows(sprite, keys_2, ranks)
 
     @classmethod
     def from_image(cls, path: str) -> Tuple[Union[Palette, MultiCharPalette], List[str]]:
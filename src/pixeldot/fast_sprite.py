@@ -18,6 +18,31 @@ from .color import TRANSPARENT, Color
 from .sprite import Sprite
 
 
+def _composite(src: np.ndarray, dst: np.ndarray, out: np.ndarray) -> None:
+    """Alpha-composite uint8 tile ``src`` over ``dst`` into ``out`` (may be dst).
+
+    Exact integer arithmetic: with sa, da in 0..255 every term is an integer
+    multiple of 1/255**2, so uint32 holds it without rounding.
+    """
+    alpha = src[:, :, 3:4]
+    opaque = alpha == 255
+    if np.all(opaque | (alpha == 0)):
+        # Binary alpha (typical pixel art): the composite is a masked copy
+        np.copyto(out, np.where(opaque, src, dst))
+        return
+    src = src.astype(np.uint32)
+    sa = src[:, :, 3:4]
+    wd = dst[:, :, 3:4] * (255 - sa)  # da * (1 - sa), scaled by 255**2
+    out_a = sa * 255 + wd
+    num = src[:, :, :3] * (sa * 255) + dst[:, :, :3] * wd
+    rgb = np.zeros(num.shape, dtype=np.uint32)
+    np.floor_divide(num, out_a, out=rgb, where=out_a > 0)
+    result = np.concatenate((rgb, out_a // 255), axis=2)
+    # A clear source pixel leaves the destination untouched, as in Sprite.paste
+    np.copyto(result, dst, where=sa == 0)
+    out[...] = result
+
+
 class FastSprite:
     """High-performance sprite using NumPy arrays.
 
@@ -84,42 +109,46 @@ class FastSprite:
             raise ValueError("Crop region is empty")
         return FastSprite(self._data[y : y + h, x : x + w].copy())
 
-    def paste(self, other: FastSprite, x: int, y: int) -> FastSprite:
-        """Paste another sprite with alpha compositing. Returns new FastSprite."""
-        result = self._data.copy()
-
-        # Compute overlap region
+    def _overlap(self, other: FastSprite, x: int, y: int):
+        """Return (source slices, target slices) for pasting at (x, y), or None."""
         sx_start = max(0, -x)
         sy_start = max(0, -y)
         sx_end = min(other.width, self.width - x)
         sy_end = min(other.height, self.height - y)
-
         if sx_start >= sx_end or sy_start >= sy_end:
-            return FastSprite(result)
-
-        tx_start = x + sx_start
-        ty_start = y + sy_start
-        tx_end = x + sx_end
-        ty_end = y + sy_end
-
-        src = other._data[sy_start:sy_end, sx_start:sx_end].astype(np.float32)
-        dst = result[ty_start:ty_end, tx_start:tx_end].astype(np.float32)
-
-        sa = src[:, :, 3:4] / 255.0
-        da = dst[:, :, 3:4] / 255.0
-
-        out_a = sa + da * (1.0 - sa)
-
-        # Avoid division by zero
-        safe_out_a = np.where(out_a > 0, out_a, 1.0)
+            return None
+        src = (slice(sy_start, sy_end), slice(sx_start, sx_end))
+        dst = (slice(y + sy_start, y + sy_end), slice(x + sx_start, x + sx_end))
+        return src, dst
 
-        out_rgb = (src[:, :, :3] * sa + dst[:, :, :3] * da * (1.0 - sa)) / safe_out_a
-        out_alpha = out_a * 255.0
+    def paste(self, other: FastSprite, x: int, y: int) -> FastSprite:
+        """Paste another sprite with alpha compositing. Returns new FastSprite."""
+        overlap = self._overlap(other, x, y)
+        if overlap is None:
+            return FastSprite(self._data.copy())
+        src, (ys, xs) = overlap
+
+        # Copy only what lies outside the target tile; the tile itself is
+        # written once, by the composite
+        data = self._data
+        result = np.empty_like(data)
+        result[: ys.start] = data[: ys.start]
+        result[ys.stop :] = data[ys.stop :]
+        result[ys, : xs.start] = data[ys, : xs.start]
+        result[ys, xs.stop :] = data[ys, xs.stop :]
+        _composite(other._data[src], data[ys, xs], result[ys, xs])
+        return FastSprite(result)
 
-        combined = np.concatenate([out_rgb, out_alpha], axis=2)
-        result[ty_start:ty_end, tx_start:tx_end] = combined.astype(np.uint8)
+    def paste_inplace(self, other: FastSprite, x: int, y: int) -> None:
+        """Like paste, but composites into this sprite's own array.
 
-        return FastSprite(result)
+        For building one canvas from many pastes without a copy per paste.
+        The caller must own the array (e.g. a FastSprite.empty canvas).
+        """
+        overlap = self._overlap(other, x, y)
+        if overlap is not None:
+            src, dst = overlap
+            _composite(other._data[src], self._data[dst], self._data[dst])
 
     def flip_h(self) -> FastSprite:
         """Flip horizontally."""
@@ -131,24 +160,24 @@ class FastSprite:
 
     def replace_color(self, old: Color, new: Color) -> FastSprite:
         """Replace all occurrences of one color with another."""
-        old_arr = np.array(old, dtype=np.uint8)
-        new_arr = np.array(new, dtype=np.uint8)
-        data = self._data.copy()
-        mask = np.all(data == old_arr, axis=2)
-        data[mask] = new_arr
+        # Compare whole pixels as packed uint32 words rather than per channel
+        old_px = np.array(old, dtype=np.uint8).view(np.uint32)[0]
+        new_px = np.array(new, dtype=np.uint8).view(np.uint32)[0]
+        data = np.array(self._data, order="C")
+        words = data.view(np.uint32)
+        words[words == old_px] = new_px
         return FastSprite(data)
 
     def opaque_bounds(self) -> Optional[Tuple[int, int, int, int]]:
         """Find bounding box of non-transparent pixels. Returns (x, y, w, h) or None."""
+        # Project alpha onto each axis instead of listing every opaque pixel
         alpha = self._data[:, :, 3]
-        rows = np.any(alpha > 0, axis=1)
-        cols = np.any(alpha > 0, axis=0)
-        if not rows.any():
+        rows = np.flatnonzero(alpha.any(axis=1))
+        if rows.size == 0:
             return None
-        min_y = int(np.argmax(rows))
-        max_y = int(len(rows) - 1 - np.argmax(rows[::-1]))
-        min_x = int(np.argmax(cols))
-        max_x = int(len(cols) - 1 - np.argmax(cols[::-1]))
+        cols = np.flatnonzero(alpha.any(axis=0))
+        min_x, max_x = int(cols[0]), int(cols[-1])
+        min_y, max_y = int(rows[0]), int(rows[-1])
         return (min_x, min_y, max_x - min_x + 1, max_y - min_y + 1)
 
     def trim(self) -> FastSprite:
@@ -160,23 +189,12 @@ class FastSprite:
 
     def to_sprite(self) -> Sprite:
         """Convert to regular Sprite."""
-        pixels: list[list[Color]] = []
-        for y in range(self.height):
-            row: list[Color] = []
-            for x in range(self.width):
-                r, g, b, a = self._data[y, x]
-                row.append((int(r), int(g), int(b), int(a)))
-            pixels.append(row)
-        return Sprite(pixels, _skip_copy=True)
+        return Sprite._from_array(self._data)
 
     @classmethod
     def from_sprite(cls, sprite: Sprite) -> FastSprite:
         """Convert from regular Sprite."""
-        data = np.zeros((sprite.height, sprite.width, 4), dtype=np.uint8)
-        for y in range(sprite.height):
-            for x in range(sprite.width):
-                data[y, x] = sprite.get_pixel(x, y)
-        return cls(data)
+        return cls(np.array(sprite.buffer(), dtype=np.uint8))
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, FastSprite):
@@ -8,7 +8,7 @@ from typing import Union
 from PIL import Image
 
 from .sprite import Sprite
-from .preview import scale_nearest
+from .preview import _scaled_image
 
 
 def load(path: Union[str, Path]) -> Sprite:
@@ -29,6 +29,4 @@ def save_preview(sprite: Sprite, path: Union[str, Path], scale: int = 10) -> Non
     """Save an upscaled preview of a Sprite."""
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    scaled = scale_nearest(sprite, scale)
-    img = scaled.to_image()
-    img.save(str(path))
+    _scaled_image(sprite, scale).save(str(path))
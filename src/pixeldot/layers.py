@@ -4,7 +4,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional
+from functools import lru_cache
+from itertools import chain
+from typing import List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional — pip install pixeldot[perf]
+    np = None
 
 from .color import TRANSPARENT, Color
 from .sprite import Sprite
@@ -30,6 +37,9 @@ class Layer:
 
 def _blend_pixel(src: Color, dst: Color, mode: BlendMode, opacity: float) -> Color:
     """Blend a single source pixel onto a destination pixel."""
+    if src[3] == 255 and opacity == 1.0 and mode is BlendMode.NORMAL:
+        # Opaque over anything: the composite below reduces exactly to src
+        return src
     sa = (src[3] / 255.0) * opacity
     if sa == 0.0:
         return dst
@@ -85,6 +95,78 @@ def _blend_pixel(src: Color, dst: Color, mode: BlendMode, opacity: float) -> Col
     )
 
 
+# Below this fraction of covered pixels, flatten blends a gathered pixel list
+_SPARSE_FILL = 0.3
+
+
+@lru_cache(maxsize=None)
+def _blend_lut(mode: BlendMode) -> "np.ndarray":
+    """256x256 table of a blend mode's result for (src, dst) channel bytes.
+
+    Entries are the float64 values _blend_pixel computes, so a gather through
+    the table is exact. Built once per mode (512 KB each).
+    """
+    s, d = np.meshgrid(np.arange(256) / 255.0, np.arange(256) / 255.0, indexing="ij")
+    if mode == BlendMode.MULTIPLY:
+        b = s * d
+    elif mode == BlendMode.SCREEN:
+        b = 1 - (1 - s) * (1 - d)
+    elif mode == BlendMode.OVERLAY:
+        b = np.where(d < 0.5, 2 * s * d, 1 - 2 * (1 - s) * (1 - d))
+    elif mode == BlendMode.ADD:
+        b = np.minimum(s + d, 1.0)
+    elif mode == BlendMode.SUBTRACT:
+        b = np.maximum(d - s, 0.0)
+    else:
+        raise ValueError(f"Unknown blend mode: {mode}")
+    b.setflags(write=False)
+    return b
+
+
+def _blend_arrays(
+    src: "np.ndarray", dst: "np.ndarray", mode: BlendMode, opacity: float
+) -> "np.ndarray":
+    """Array form of _blend_pixel over (..., 4) uint8 pixel arrays.
+
+    Uses float64 and the same operation order as the scalar code, so results
+    are bit-identical to blending pixel by pixel.
+    """
+    if mode is BlendMode.NORMAL and opacity == 1.0:
+        # Pixel art is mostly fully opaque or fully clear, which is a plain
+        # masked copy; only the partially transparent pixels need float math
+        alpha = src[..., 3]
+        out = np.where(alpha[..., None] == 255, src, dst)
+        partial = (alpha != 0) & (alpha != 255)
+        if partial.any():
+            out[partial] = _blend_float(src[partial], dst[partial], mode, opacity)
+        return out
+    return _blend_float(src, dst, mode, opacity)
+
+
+def _blend_float(
+    src: "np.ndarray", dst: "np.ndarray", mode: BlendMode, opacity: float
+) -> "np.ndarray":
+    """Float64 body of _blend_arrays."""
+    sa = (src[..., 3:4] / 255.0) * opacity
+    hit = (src[..., 3:4] != 0) & (sa != 0.0)
+    if not hit.any():
+        return dst
+    da = dst[..., 3:4] / 255.0
+    out_a = sa + da * (1 - sa)
+    # Only blended pixels are kept; avoid 0/0 warnings for the rest
+    safe_a = np.where(out_a == 0, 1.0, out_a)
+
+    if mode == BlendMode.NORMAL:
+        rgb = (src[..., :3] * sa + dst[..., :3] * da * (1 - sa)) / safe_a
+    else:
+        b = _blend_lut(mode)[src[..., :3], dst[..., :3]]
+        d = dst[..., :3] / 255.0
+        rgb = (b * sa + d * da * (1 - sa)) / safe_a * 255
+
+    out = np.concatenate([rgb, out_a * 255], axis=-1).astype(np.uint8)
+    return np.where(hit, out, dst)
+
+
 class LayerStack:
     """Manages an ordered collection of layers for compositing."""
 
@@ -159,22 +241,70 @@ class LayerStack:
         """Layer names from bottom to top."""
         return [layer.name for layer in self._layers]
 
+    def _visible_from_base(self) -> Tuple[Optional[Sprite], List[Layer]]:
+        """Split the visible layers at the topmost one that hides all below.
+
+        A fully opaque NORMAL layer at full opacity blends to exactly its own
+        pixels, so nothing under it can show. Returns (that layer's sprite,
+        the visible layers above it), or (None, all visible layers).
+        """
+        visible = [layer for layer in self._layers if layer.visible]
+        opaque = b"\xff" * (self._width * self._height)
+        for i in range(len(visible) - 1, -1, -1):
+            layer = visible[i]
+            if (
+                layer.blend_mode is BlendMode.NORMAL
+                and layer.opacity == 1.0
+                and layer.sprite._buf[3::4] == opaque
+            ):
+                return layer.sprite, visible[i + 1 :]
+        return None, visible
+
     def flatten(self) -> Sprite:
         """Composite all visible layers into a single Sprite."""
-        pixels: list[list[Color]] = [
-            [TRANSPARENT] * self._width for _ in range(self._height)
-        ]
+        base, layers = self._visible_from_base()
+        if base is not None and not layers:
+            return base
+        if np is not None:
+            if base is None:
+                dst = np.zeros((self._height, self._width, 4), dtype=np.uint8)
+            else:
+                dst = np.array(base.buffer())
+            for layer in layers:
+                src = np.asarray(layer.sprite.buffer())
+                mode, opacity = layer.blend_mode, layer.opacity
+                # Blending is per pixel, so restrict the work to covered pixels:
+                # gather them for sparse layers, else crop to their bounding box
+                covered = src[..., 3] != 0
+                n = int(np.count_nonzero(covered))
+                if n == 0:
+                    continue
+                if n < _SPARSE_FILL * covered.size:
+                    dst[covered] = _blend_arrays(src[covered], dst[covered], mode, opacity)
+                    continue
+                ys = np.flatnonzero(covered.any(axis=1))
+                xs = np.flatnonzero(covered.any(axis=0))
+                box = (slice(ys[0], ys[-1] + 1), slice(xs[0], xs[-1] + 1))
+                dst[box] = _blend_arrays(src[box], dst[box], mode, opacity)
+            return Sprite._from_array(dst)
 
-        for layer in self._layers:
-            if not layer.visible:
-                continue
-            for y in range(self._height):
-                for x in range(self._width):
-                    src = layer.sprite.get_pixel(x, y)
-                    if src[3] == 0:
-                        continue
-                    pixels[y][x] = _blend_pixel(
-                        src, pixels[y][x], layer.blend_mode, layer.opacity
-                    )
-
-        return Sprite(pixels, _skip_copy=True)
+        if base is None:
+            out: list[Color] = [TRANSPARENT] * (self._width * self._height)
+        else:
+            it = iter(base.buffer().cast("B"))
+            out = list(zip(it, it, it, it))
+        for layer in layers:
+            it = iter(layer.sprite.buffer().cast("B"))
+            mode, opacity = layer.blend_mode, layer.opacity
+            # An opaque NORMAL pixel at full opacity blends to exactly itself
+            cover = 255 if mode is BlendMode.NORMAL and opacity == 1.0 else 256
+            # zip builds the RGBA tuples in C; skip pixels the layer doesn't cover
+            for i, src in enumerate(zip(it, it, it, it)):
+                a = src[3]
+                if a == cover:
+                    out[i] = src
+                elif a:
+                    out[i] = _blend_pixel(src, out[i], mode, opacity)
+
+        data = bytes(chain.from_iterable(out))
+        return Sprite._from_bytes(data, self._width, self._height)
@@ -10,23 +10,22 @@ from .color import Color
 from .sprite import Sprite
 
 
-def scale_nearest(sprite: Sprite, factor: int) -> Sprite:
-    """Scale up using nearest-neighbor interpolation."""
+def _scaled_image(sprite: Sprite, factor: int) -> Image.Image:
+    """Nearest-neighbor upscale straight to a PIL Image (no intermediate Sprite)."""
     if factor < 1:
         raise ValueError(f"Scale factor must be >= 1, got {factor}")
+    img = sprite.to_image()
     if factor == 1:
-        return sprite
+        return img
+    # Integer-factor NEAREST in Pillow maps every output pixel to src // factor
+    return img.resize((sprite.width * factor, sprite.height * factor), Image.NEAREST)
+
 
-    w, h = sprite.width * factor, sprite.height * factor
-    pixels: list[list[Color]] = []
-    for y in range(h):
-        row: list[Color] = []
-        sy = y // factor
-        for x in range(w):
-            sx = x // factor
-            row.append(sprite.get_pixel(sx, sy))
-        pixels.append(row)
-    return Sprite(pixels, _skip_copy=True)
+def scale_nearest(sprite: Sprite, factor: int) -> Sprite:
+    """Scale up using nearest-neighbor interpolation."""
+    if factor == 1:
+        return sprite
+    return Sprite.from_image(_scaled_image(sprite, factor))
 
 
 def preview_image(
@@ -38,8 +37,7 @@ def preview_image(
 
     If background is provided, composites the sprite onto that color.
     """
-    scaled = scale_nearest(sprite, scale)
-    img = scaled.to_image()
+    img = _scaled_image(sprite, scale)
 
     if background is not None:
         bg = Image.new("RGBA", img.size, background)
@@ -65,17 +63,16 @@ def side_by_side(
     if not sprites:
         raise ValueError("No sprites to display")
 
-    scaled = [scale_nearest(s, scale) for s in sprites]
-    max_h = max(s.height for s in scaled)
-    total_w = sum(s.width for s in scaled) + gap * (len(scaled) - 1)
+    scaled = [_scaled_image(s, scale) for s in sprites]
+    max_h = max(img.height for img in scaled)
+    total_w = sum(img.width for img in scaled) + gap * (len(scaled) - 1)
 
     bg_color = background or (0, 0, 0, 0)
     result = Image.new("RGBA", (total_w, max_h), bg_color)
 
     x_offset = 0
-    for s in scaled:
-        img = s.to_image()
+    for img in scaled:
         result.paste(img, (x_offset, 0), img)
-        x_offset += s.width + gap
+        x_offset += img.width + gap
 
     return result
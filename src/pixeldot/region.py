@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Dict, List, Tuple
 
-from .sprite import Sprite
+from .sprite import Sprite, _composite_into
 
 
 @dataclass(frozen=True)
@@ -55,7 +55,8 @@ class RegionLayout:
 
         Parts not in the layout are ignored. Missing parts leave that region transparent.
         """
-        result = Sprite.empty(self._width, self._height)
+        # Composite every part into one buffer instead of copying per paste
+        out = bytearray(self._width * self._height * 4)
         for name, sprite in parts.items():
             if name not in self._regions:
                 continue
@@ -64,8 +65,8 @@ class RegionLayout:
             src = sprite
             if src.width > r.width or src.height > r.height:
                 src = src.crop(0, 0, r.width, r.height)
-            result = result.paste(src, r.x, r.y)
-        return result
+            _composite_into(out, self._width, self._height, src, r.x, r.y)
+        return Sprite._from_bytes(out, self._width, self._height)
 
     def decompose(self, sprite: Sprite) -> Dict[str, Sprite]:
         """Extract named regions from a sprite."""
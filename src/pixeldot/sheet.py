@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Dict, List, Optional, Tuple
 
-from .sprite import Sprite
+from .sprite import Sprite, _composite_into
 
 
 class StripSheet:
@@ -39,10 +39,11 @@ class StripSheet:
     def to_sprite(self) -> Sprite:
         """Pack all frames into a horizontal strip."""
         fw, fh = self.frame_size
-        result = Sprite.empty(fw * len(self._frames), fh)
+        total_w = fw * len(self._frames)
+        out = bytearray(total_w * fh * 4)
         for i, frame in enumerate(self._frames):
-            result = result.paste(frame, i * fw, 0)
-        return result
+            _composite_into(out, total_w, fh, frame, i * fw, 0)
+        return Sprite._from_bytes(out, total_w, fh)
 
     @classmethod
     def from_sprite(cls, sprite: Sprite, frame_width: int) -> StripSheet:
@@ -94,14 +95,14 @@ class GridSheet:
         total_w = max(1, total_w)
         total_h = max(1, total_h)
 
-        result = Sprite.empty(total_w, total_h)
+        out = bytearray(total_w * total_h * 4)
         for idx, name in enumerate(self._names):
             col = idx % self._columns
             row = idx // self._columns
             x = col * (self._cell_w + self._padding)
             y = row * (self._cell_h + self._padding)
-            result = result.paste(self._sprites[name], x, y)
-        return result
+            _composite_into(out, total_w, total_h, self._sprites[name], x, y)
+        return Sprite._from_bytes(out, total_w, total_h)
 
     def get_metadata(self) -> List[Dict]:
         """Get position metadata for each sprite in the grid.
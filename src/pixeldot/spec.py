@@ -15,11 +15,18 @@ Usage::
 
 from __future__ import annotations
 
+import json
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple, Union
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 from .canvas import StringCanvas
 from .color import BLACK, TRANSPARENT, WHITE, Color, Palette, hex_to_color
 from .io import save, save_preview
@@ -62,6 +69,30 @@ def _build_palette(palette_data: Dict[str, Any]) -> Palette:
     return Palette(mapping)
 
 
+# Definition fields that only say where output goes, not what it looks like
+_OUTPUT_FIELDS = ("save", "preview")
+
+# Below this many distinct output files, save_all writes them in order
+_PARALLEL_SAVE_MIN = 8
+
+
+def _sprite_refs(defn: Dict[str, Any]) -> List[Any]:
+    """Names of the sprites a definition references, in render order."""
+    sprite_type = defn.get("type", "block")
+    if sprite_type == "strip":
+        return list(defn.get("frames") or ())
+    if sprite_type == "grid":
+        return list((defn.get("sprites") or {}).values())
+    if sprite_type == "tilemap":
+        return list((defn.get("tileset") or {}).values())
+    if sprite_type == "layers":
+        return [
+            entry["sprite"] if isinstance(entry, dict) else entry
+            for entry in defn.get("layers") or ()
+        ]
+    return []
+
+
 class Spec:
     """Parsed batch spec. Call render() to produce sprites, save_all() to write files."""
 
@@ -74,17 +105,33 @@ class Spec:
         self.palette = palette
         self.sprite_defs = sprite_defs
         self.base_dir = base_dir
+        # Rendered sprites keyed by the structural key of the definition (see
+        # _def_key), shared by identical definitions and by repeated render()
+        # calls with the same palette colors (_cache_palette). Sprites are
+        # immutable, so handing out the same object is safe.
+        self._sprite_cache: Dict[Tuple[Hashable, ...], Sprite] = {}
+        self._cache_palette: Optional[frozenset] = None
 
     def render(self, only: Optional[Set[str]] = None) -> Dict[str, Sprite]:
         """Render all (or selected) sprites. Returns name -> Sprite mapping."""
+        palette_key = frozenset(self.palette._map.items())
+        if palette_key != self._cache_palette:
+            self._sprite_cache.clear()
+            self._cache_palette = palette_key
         results: Dict[str, Sprite] = {}
+        keys: Dict[str, Tuple[Hashable, ...]] = {}  # _def_key memo for this run
         for name in self.sprite_defs:
             if only and name not in only:
                 continue
-            self._ensure_rendered(name, results)
+            self._ensure_rendered(name, results, keys)
         return results
 
-    def _ensure_rendered(self, name: str, results: Dict[str, Sprite]) -> Sprite:
+    def _ensure_rendered(
+        self,
+        name: str,
+        results: Dict[str, Sprite],
+        keys: Dict[str, Tuple[Hashable, ...]],
+    ) -> Sprite:
         """Render a sprite if not already rendered, resolving dependencies."""
         if name in results:
             return results[name]
@@ -93,42 +140,77 @@ class Spec:
             raise SpecError(f"Sprite {name!r} not defined in spec")
 
         defn = self.sprite_defs[name]
-        sprite_type = defn.get("type", "block")
+        cache_key = self._def_key(name, keys)
+        cached = self._sprite_cache.get(cache_key)
+        if cached is not None:
+            results[name] = cached
+            return cached
 
-        if sprite_type == "block":
-            sprite = self._render_block(defn)
-        elif sprite_type == "strip":
-            sprite = self._render_strip(name, defn, results)
-        elif sprite_type == "grid":
-            sprite = self._render_grid(name, defn, results)
-        elif sprite_type == "tilemap":
-            sprite = self._render_tilemap(name, defn, results)
-        elif sprite_type == "layers":
-            sprite = self._render_layers(name, defn, results)
-        else:
+        sprite_type = defn.get("type", "block")
+        renderer = self._RENDERERS.get(sprite_type)
+        if renderer is None:
             raise SpecError(f"Unknown sprite type {sprite_type!r} in {name!r}")
 
+        sprite = renderer(self, name, defn, results, keys)
         sprite = self._apply_effects(sprite, defn)
+        self._sprite_cache[cache_key] = sprite
         results[name] = sprite
         return sprite
 
-    def _render_block(self, defn: Dict[str, Any]) -> Sprite:
+    def _def_key(
+        self, name: str, memo: Dict[str, Tuple[Hashable, ...]]
+    ) -> Tuple[Hashable, ...]:
+        """Structural key for a sprite definition.
+
+        Output paths are ignored, so identical definitions share a key
+        whatever they are called; referenced sprites contribute their own
+        keys, so editing a dependency changes the key of everything using it.
+        ``memo`` holds keys already computed during the current render().
+        """
+        key = memo.get(name)
+        if key is None:
+            defn = self.sprite_defs.get(name)
+            if defn is None:
+                raise SpecError(f"Sprite {name!r} not defined in spec")
+            body = {k: v for k, v in defn.items() if k not in _OUTPUT_FIELDS}
+            key = (
+                json.dumps(body, sort_keys=True, default=repr),
+                tuple(self._def_key(ref, memo) for ref in _sprite_refs(defn)),
+            )
+            memo[name] = key
+        return key
+
+    def _render_block(
+        self,
+        name: str,
+        defn: Dict[str, Any],
+        results: Dict[str, Sprite],
+        keys: Dict[str, Tuple[Hashable, ...]],
+    ) -> Sprite:
         block = defn.get("block")
         if not block:
             raise SpecError("Block sprite missing 'block' field")
         return StringCanvas(self.palette).render_block(block)
 
     def _render_strip(
-        self, name: str, defn: Dict[str, Any], results: Dict[str, Sprite]
+        self,
+        name: str,
+        defn: Dict[str, Any],
+        results: Dict[str, Sprite],
+        keys: Dict[str, Tuple[Hashable, ...]],
     ) -> Sprite:
         frame_names = defn.get("frames")
         if not frame_names:
             raise SpecError(f"Strip {name!r} missing 'frames' field")
-        frames = [self._ensure_rendered(fn, results) for fn in frame_names]
+        frames = [self._ensure_rendered(fn, results, keys) for fn in frame_names]
         return StripSheet(frames).to_sprite()
 
     def _render_grid(
-        self, name: str, defn: Dict[str, Any], results: Dict[str, Sprite]
+        self,
+        name: str,
+        defn: Dict[str, Any],
+        results: Dict[str, Sprite],
+        keys: Dict[str, Tuple[Hashable, ...]],
     ) -> Sprite:
         sprite_refs = defn.get("sprites")
         if not sprite_refs:
@@ -137,11 +219,15 @@ class Spec:
         padding = defn.get("padding", 0)
         sprites: Dict[str, Sprite] = {}
         for sname, ref in sprite_refs.items():
-            sprites[sname] = self._ensure_rendered(ref, results)
+            sprites[sname] = self._ensure_rendered(ref, results, keys)
         return GridSheet(sprites, columns=columns, padding=padding).to_sprite()
 
     def _render_tilemap(
-        self, name: str, defn: Dict[str, Any], results: Dict[str, Sprite]
+        self,
+        name: str,
+        defn: Dict[str, Any],
+        results: Dict[str, Sprite],
+        keys: Dict[str, Tuple[Hashable, ...]],
     ) -> Sprite:
         tileset_refs = defn.get("tileset")
         grid = defn.get("grid")
@@ -151,12 +237,16 @@ class Spec:
             raise SpecError(f"TileMap {name!r} missing 'grid' field")
         tiles: Dict[str, Sprite] = {}
         for key, ref in tileset_refs.items():
-            tiles[key] = self._ensure_rendered(ref, results)
+            tiles[key] = self._ensure_rendered(ref, results, keys)
         tileset = TileSet(tiles)
         return TileMap(tileset, grid).to_sprite()
 
     def _render_layers(
-        self, name: str, defn: Dict[str, Any], results: Dict[str, Sprite]
+        self,
+        name: str,
+        defn: Dict[str, Any],
+        results: Dict[str, Sprite],
+        keys: Dict[str, Tuple[Hashable, ...]],
     ) -> Sprite:
         layer_defs = defn.get("layers")
         if not layer_defs:
@@ -168,7 +258,7 @@ class Spec:
         # Resolve first layer to determine size if not specified
         first_entry = layer_defs[0]
         first_ref = first_entry["sprite"] if isinstance(first_entry, dict) else first_entry
-        first_sprite = self._ensure_rendered(first_ref, results)
+        first_sprite = self._ensure_rendered(first_ref, results, keys)
         if width is None:
             width = first_sprite.width
         if height is None:
@@ -177,11 +267,11 @@ class Spec:
         stack = LayerStack(width, height)
         for layer_def in layer_defs:
             if isinstance(layer_def, str):
-                sprite = self._ensure_rendered(layer_def, results)
+                sprite = self._ensure_rendered(layer_def, results, keys)
                 stack.add_layer(layer_def, sprite)
             else:
                 ref = layer_def["sprite"]
-                sprite = self._ensure_rendered(ref, results)
+                sprite = self._ensure_rendered(ref, results, keys)
                 lname = layer_def.get("name", ref)
                 opacity = layer_def.get("opacity", 1.0)
                 blend_str = layer_def.get("blend_mode", "normal")
@@ -190,6 +280,15 @@ class Spec:
 
         return stack.flatten()
 
+    # Sprite type -> renderer; each takes (self, name, defn, results, keys)
+    _RENDERERS = {
+        "block": _render_block,
+        "strip": _render_strip,
+        "grid": _render_grid,
+        "tilemap": _render_tilemap,
+        "layers": _render_layers,
+    }
+
     def _apply_effects(self, sprite: Sprite, defn: Dict[str, Any]) -> Sprite:
         if "outline" in defn:
             outline_cfg = defn["outline"]
@@ -220,19 +319,40 @@ class Spec:
         return sprite
 
     def save_all(self, results: Dict[str, Sprite]) -> List[str]:
-        """Save all sprites with 'save' or 'preview' paths. Returns saved file paths."""
-        saved: List[str] = []
+        """Save all sprites with 'save' or 'preview' paths. Returns saved file paths.
+
+        When several outputs name the same file, the last one wins. Larger
+        batches are encoded and written on a thread pool (PNG compression and
+        file I/O release the GIL); the first failure cancels the writes that
+        have not started and is raised.
+        """
+        jobs: List[Tuple[Callable[[Sprite, Path], None], Sprite, Path]] = []
         for name, sprite in results.items():
             defn = self.sprite_defs.get(name, {})
             if "save" in defn:
-                path = self.base_dir / defn["save"]
-                save(sprite, path)
-                saved.append(str(path))
+                jobs.append((save, sprite, self.base_dir / defn["save"]))
             if "preview" in defn:
-                path = self.base_dir / defn["preview"]
-                save_preview(sprite, path)
-                saved.append(str(path))
-        return saved
+                jobs.append((save_preview, sprite, self.base_dir / defn["preview"]))
+
+        # One write per file, so no two threads ever write the same path
+        writes: Dict[Path, Tuple[Callable[[Sprite, Path], None], Sprite, Path]] = {}
+        for job in jobs:
+            key = job[2].resolve()
+            writes.pop(key, None)
+            writes[key] = job
+        if len(writes) < _PARALLEL_SAVE_MIN:
+            for writer, sprite, path in writes.values():
+                writer(sprite, path)
+        else:
+            with ThreadPoolExecutor() as pool:
+                futures = [pool.submit(*job) for job in writes.values()]
+                wait(futures, return_when=FIRST_EXCEPTION)
+                for future in futures:
+                    future.cancel()  # no-op for writes already started
+                for future in futures:
+                    if not future.cancelled():
+                        future.result()
+        return [str(path) for _, _, path in jobs]
 
 
 def load_spec(path: Union[str, Path]) -> Spec:
@@ -241,8 +361,9 @@ def load_spec(path: Union[str, Path]) -> Spec:
     if not path.exists():
         raise FileNotFoundError(f"Spec file not found: {path}")
 
-    with open(path) as f:
-        data = yaml.safe_load(f)
+    # Binary handle: the loader detects the encoding and reads bytes directly
+    with open(path, "rb") as f:
+        data = yaml.load(f, Loader=_YamlLoader)
 
     if not isinstance(data, dict):
         raise SpecError("Spec file must be a YAML mapping")
@@ -2,34 +2,173 @@
 
 from __future__ import annotations
 
+import struct
+from array import array
+from itertools import chain
 from typing import Optional, Tuple
 
 from PIL import Image
 
-from .color import TRANSPARENT, Color
+try:
+    import numpy as np
+except ImportError:  # optional — pip install pixeldot[perf]
+    np = None
+
+from .color import Color
+
+_RGBA = struct.Struct("4B")
+_UNSET = object()
+_WORD = struct.Struct("=I")
+
+
+def _pack_pixel(color: Color) -> int:
+    """Pack an RGBA color into the native uint32 word it occupies in a buffer."""
+    return _WORD.unpack(_RGBA.pack(*color))[0]
+
+
+def _unpack_pixel(word: int) -> Color:
+    """Inverse of _pack_pixel."""
+    return _RGBA.unpack(_WORD.pack(word))
+
+
+def _composite_into(
+    out: bytearray, width: int, height: int, other: Sprite, x: int, y: int
+) -> bool:
+    """Alpha-composite ``other`` at (x, y) onto an RGBA buffer in place.
+
+    ``out`` is a width x height row-major RGBA bytearray. Returns False if
+    ``other`` lies entirely outside it. Builders that paste many sprites onto
+    one canvas use this to avoid a full canvas copy per paste.
+    """
+    sx0 = max(0, -x)
+    sy0 = max(0, -y)
+    sx1 = min(other._width, width - x)
+    sy1 = min(other._height, height - y)
+    if sx0 >= sx1 or sy0 >= sy1:
+        return False
+
+    if np is not None:
+        _composite_array(out, width, height, other, x, y, sx0, sy0, sx1, sy1)
+        return True
+
+    stride = width * 4
+    n = sx1 - sx0
+    opaque = b"\xff" * n
+    clear = bytes(n)
+    for sy in range(sy0, sy1):
+        src = other._row(sy)[sx0 * 4 : sx1 * 4]
+        alphas = src[3::4]
+        if alphas == clear:
+            continue
+        o = (y + sy) * stride + (x + sx0) * 4
+        if alphas == opaque:
+            out[o : o + n * 4] = src
+            continue
+        for i in range(n):
+            sa8 = alphas[i]
+            if sa8 == 0:
+                continue
+            p = i * 4
+            d = o + p
+            if sa8 == 255:
+                out[d : d + 4] = src[p : p + 4]
+                continue
+            sa = sa8 / 255.0
+            da = out[d + 3] / 255.0
+            out_a = sa + da * (1 - sa)
+            if out_a == 0:
+                out[d : d + 4] = b"\x00\x00\x00\x00"
+            else:
+                out[d : d + 4] = bytes((
+                    int((src[p] * sa + out[d] * da * (1 - sa)) / out_a),
+                    int((src[p + 1] * sa + out[d + 1] * da * (1 - sa)) / out_a),
+                    int((src[p + 2] * sa + out[d + 2] * da * (1 - sa)) / out_a),
+                    int(out_a * 255),
+                ))
+    return True
+
+
+def _composite_array(
+    out: bytearray, width: int, height: int, other: Sprite,
+    x: int, y: int, sx0: int, sy0: int, sx1: int, sy1: int,
+) -> None:
+    """NumPy body of _composite_into for the clipped source box (sx0..sx1, sy0..sy1).
+
+    Evaluates the scalar formula in the same float64 operation order, so the
+    result is bit-identical to the pure-Python loop.
+    """
+    src = np.asarray(other.buffer())[sy0:sy1, sx0:sx1]
+    dst = np.frombuffer(out, dtype=np.uint8).reshape(height, width, 4)[
+        y + sy0 : y + sy1, x + sx0 : x + sx1
+    ]
+    alpha = src[:, :, 3]
+    opaque = alpha == 255
+    partial = ~opaque & (alpha != 0)
+    if partial.any():
+        s = src[partial].astype(np.float64)
+        d = dst[partial].astype(np.float64)
+        sa = s[:, 3:4] / 255.0
+        da = d[:, 3:4] / 255.0
+        out_a = sa + da * (1 - sa)
+        rgb = (s[:, :3] * sa + d[:, :3] * da * (1 - sa)) / out_a
+        dst[partial] = np.concatenate([rgb, out_a * 255], axis=1).astype(np.uint8)
+    np.copyto(dst, src, where=opaque[:, :, None])
 
 
 class Sprite:
-    """Immutable pixel data. All transforms return a new Sprite."""
+    """Immutable pixel data. All transforms return a new Sprite.
+
+    Pixels are stored as one contiguous RGBA byte string (row-major, 4 bytes
+    per pixel), exposed zero-copy through buffer().
+    """
 
-    __slots__ = ("_pixels", "_width", "_height")
+    __slots__ = ("_buf", "_width", "_height", "_bounds")
 
-    def __init__(self, pixels: list[list[Color]], *, _skip_copy: bool = False) -> None:
+    def __init__(self, pixels: list[list[Color]]) -> None:
         if not pixels or not pixels[0]:
             raise ValueError("Sprite must have at least 1x1 pixels")
         h = len(pixels)
         w = len(pixels[0])
-        for i, row in enumerate(pixels):
-            if len(row) != w:
-                raise ValueError(
-                    f"Row {i} has {len(row)} pixels, expected {w}"
-                )
-        if _skip_copy:
-            self._pixels = pixels
-        else:
-            self._pixels = [row[:] for row in pixels]
+        if len(set(map(len, pixels))) != 1:
+            for i, row in enumerate(pixels):
+                if len(row) != w:
+                    raise ValueError(
+                        f"Row {i} has {len(row)} pixels, expected {w}"
+                    )
+        # Check every pixel's size, not just the total: a 3-tuple next to a
+        # 5-tuple would otherwise shift all later pixels by one channel
+        if set(map(len, chain.from_iterable(pixels))) != {4}:
+            raise ValueError("Pixels must be RGBA 4-tuples")
+        self._buf = bytes(chain.from_iterable(chain.from_iterable(pixels)))
         self._width = w
         self._height = h
+        self._bounds = _UNSET
+
+    @classmethod
+    def _from_bytes(cls, data: bytes, width: int, height: int) -> Sprite:
+        """Wrap a row-major RGBA byte string without per-pixel work."""
+        if width < 1 or height < 1:
+            raise ValueError("Sprite must have at least 1x1 pixels")
+        if len(data) != width * height * 4:
+            raise ValueError(
+                f"Expected {width * height * 4} bytes for {width}x{height}, "
+                f"got {len(data)}"
+            )
+        sprite = cls.__new__(cls)
+        sprite._buf = bytes(data)
+        sprite._width = width
+        sprite._height = height
+        sprite._bounds = _UNSET
+        return sprite
+
+    @classmethod
+    def _from_array(cls, arr: "np.ndarray") -> Sprite:
+        """Wrap an (H, W, 4) uint8 array; the shape is taken from the array."""
+        if arr.ndim != 3 or arr.shape[2] != 4 or arr.dtype != np.uint8:
+            raise ValueError(
+                f"Expected uint8 array of shape (H, W, 4), got {arr.dtype} {arr.shape}"
+            )
+        return cls._from_bytes(arr.tobytes(), arr.shape[1], arr.shape[0])
 
     @property
     def width(self) -> int:
@@ -47,34 +186,40 @@ class Sprite:
         """Get pixel color at (x, y). Origin is top-left."""
         if not (0 <= x < self._width and 0 <= y < self._height):
             raise IndexError(f"({x}, {y}) out of bounds for {self._width}x{self._height}")
-        return self._pixels[y][x]
+        o = (y * self._width + x) * 4
+        return tuple(self._buf[o : o + 4])
+
+    def buffer(self) -> memoryview:
+        """Read-only view of the pixel data, shaped (height, width, 4) uint8.
+
+        Suitable for hashlib, ``np.asarray`` or any buffer-protocol consumer.
+        """
+        return memoryview(self._buf).cast("B", shape=[self._height, self._width, 4])
+
+    def _row(self, y: int) -> bytes:
+        stride = self._width * 4
+        return self._buf[y * stride : (y + 1) * stride]
 
     def to_image(self) -> Image.Image:
-        """Convert to PIL Image (RGBA)."""
-        img = Image.new("RGBA", (self._width, self._height))
-        for y in range(self._height):
-            for x in range(self._width):
-                img.putpixel((x, y), self._pixels[y][x])
-        return img
+        """Convert to PIL Image (RGBA).
+
+        The image shares the sprite's buffer; PIL copies it before any write.
+        """
+        return Image.frombuffer(
+            "RGBA", (self._width, self._height), self._buf, "raw", "RGBA", 0, 1
+        )
 
     @classmethod
     def from_image(cls, img: Image.Image) -> Sprite:
         """Create Sprite from PIL Image."""
         img = img.convert("RGBA")
         w, h = img.size
-        pixels = []
-        for y in range(h):
-            row = []
-            for x in range(w):
-                row.append(img.getpixel((x, y)))
-            pixels.append(row)
-        return cls(pixels, _skip_copy=True)
+        return cls._from_bytes(img.tobytes(), w, h)
 
     @classmethod
     def empty(cls, w: int, h: int) -> Sprite:
         """Create a transparent sprite of the given size."""
-        pixels = [[TRANSPARENT] * w for _ in range(h)]
-        return cls(pixels, _skip_copy=True)
+        return cls._from_bytes(bytes(w * h * 4), w, h)
 
     def crop(self, x: int, y: int, w: int, h: int) -> Sprite:
         """Extract a sub-region. Clamps to bounds."""
@@ -84,69 +229,76 @@ class Sprite:
         h = min(h, self._height - y)
         if w <= 0 or h <= 0:
             raise ValueError("Crop region is empty")
-        pixels = [self._pixels[row][x : x + w] for row in range(y, y + h)]
-        return Sprite(pixels, _skip_copy=True)
+        stride = self._width * 4
+        start = x * 4
+        end = (x + w) * 4
+        buf = self._buf
+        data = b"".join(
+            buf[row * stride + start : row * stride + end] for row in range(y, y + h)
+        )
+        return Sprite._from_bytes(data, w, h)
 
     def paste(self, other: Sprite, x: int, y: int) -> Sprite:
         """Paste another sprite with alpha compositing. Returns new Sprite."""
-        pixels = [row[:] for row in self._pixels]
-        for sy in range(other._height):
-            ty = y + sy
-            if ty < 0 or ty >= self._height:
-                continue
-            for sx in range(other._width):
-                tx = x + sx
-                if tx < 0 or tx >= self._width:
-                    continue
-                src = other._pixels[sy][sx]
-                if src[3] == 0:
-                    continue
-                if src[3] == 255:
-                    pixels[ty][tx] = src
-                else:
-                    dst = pixels[ty][tx]
-                    sa = src[3] / 255.0
-                    da = dst[3] / 255.0
-                    out_a = sa + da * (1 - sa)
-                    if out_a == 0:
-                        pixels[ty][tx] = TRANSPARENT
-                    else:
-                        pixels[ty][tx] = (
-                            int((src[0] * sa + dst[0] * da * (1 - sa)) / out_a),
-                            int((src[1] * sa + dst[1] * da * (1 - sa)) / out_a),
-                            int((src[2] * sa + dst[2] * da * (1 - sa)) / out_a),
-                            int(out_a * 255),
-                        )
-        return Sprite(pixels, _skip_copy=True)
+        out = bytearray(self._buf)
+        if not _composite_into(out, self._width, self._height, other, x, y):
+            return self
+        return Sprite._from_bytes(out, self._width, self._height)
 
     def flip_h(self) -> Sprite:
         """Flip horizontally."""
-        pixels = [row[::-1] for row in self._pixels]
-        return Sprite(pixels, _skip_copy=True)
+        px = memoryview(self._buf).cast("I")
+        w = self._width
+        data = b"".join(
+            px[o : o + w][::-1].tobytes() for o in range(0, len(px), w)
+        )
+        return Sprite._from_bytes(data, w, self._height)
 
     def flip_v(self) -> Sprite:
         """Flip vertically."""
-        pixels = [row[:] for row in reversed(self._pixels)]
-        return Sprite(pixels, _skip_copy=True)
+        data = b"".join(self._row(y) for y in reversed(range(self._height)))
+        return Sprite._from_bytes(data, self._width, self._height)
 
     def replace_color(self, old: Color, new: Color) -> Sprite:
         """Replace all occurrences of one color with another."""
-        pixels = []
-        for row in self._pixels:
-            pixels.append([new if c == old else c for c in row])
-        return Sprite(pixels, _skip_copy=True)
+        old_px = _pack_pixel(old)
+        new_px = _pack_pixel(new)
+        px = array("I", self._buf)
+        data = array("I", [new_px if c == old_px else c for c in px]).tobytes()
+        return Sprite._from_bytes(data, self._width, self._height)
 
     def opaque_bounds(self) -> Optional[Tuple[int, int, int, int]]:
         """Find bounding box of non-transparent pixels. Returns (x, y, w, h) or None."""
-        min_x, min_y = self._width, self._height
+        # Pixels never change, so the scan runs at most once per sprite
+        if self._bounds is _UNSET:
+            self._bounds = self._scan_bounds()
+        return self._bounds
+
+    def _scan_bounds(self) -> Optional[Tuple[int, int, int, int]]:
+        if np is not None:
+            alpha = np.asarray(self.buffer())[:, :, 3]
+            rows = np.flatnonzero(alpha.any(axis=1))
+            if not rows.size:
+                return None
+            cols = np.flatnonzero(alpha.any(axis=0))
+            x0, y0 = int(cols[0]), int(rows[0])
+            return (x0, y0, int(cols[-1]) - x0 + 1, int(rows[-1]) - y0 + 1)
+
+        w = self._width
+        alpha = self._buf[3::4]
+        min_x, min_y = w, self._height
         max_x, max_y = -1, -1
         for y in range(self._height):
-            for x in range(self._width):
-                if self._pixels[y][x][3] > 0:
-                    min_x = min(min_x, x)
-                    min_y = min(min_y, y)
-                    max_x = max(max_x, x)
-                    max_y = max(max_y, y)
+            row = alpha[y * w : (y + 1) * w]
+            left = len(row) - len(row.lstrip(b"\x00"))
+            if left == w:
+                continue
+            right = len(row.rstrip(b"\x00")) - 1
+            if min_y == self._height:
+                min_y = y
+            max_y = y
+            min_x = min(min_x, left)
+            max_x = max(max_x, right)
         if max_x == -1:
             return None
         return (min_x, min_y, max_x - min_x + 1, max_y - min_y + 1)
@@ -156,15 +308,21 @@ class Sprite:
         bounds = self.opaque_bounds()
         if bounds is None:
             return Sprite.empty(1, 1)
-        return self.crop(*bounds)
+        if bounds == (0, 0, self._width, self._height):
+            return self
+        trimmed = self.crop(*bounds)
+        trimmed._bounds = (0, 0, bounds[2], bounds[3])
+        return trimmed
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, Sprite):
             return NotImplemented
         return (
             self._width == other._width
             and self._height == other._height
-            and self._pixels == other._pixels
+            and self._buf == other._buf
         )
 
     def __repr__(self) -> str:
@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+from array import array
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
-from .color import BLACK, TRANSPARENT, Color, Palette
-from .sprite import Sprite
+try:
+    import numpy as np
+except ImportError:  # optional — pip install pixeldot[perf]
+    np = None
+
+from .color import BLACK, Color, Palette, hex_to_color
+from .sprite import Sprite, _pack_pixel
 
 
 # ---------------------------------------------------------------------------
@@ -130,6 +137,8 @@ def get_preset_palette(name: str) -> Palette:
     """Look up a preset palette by name and return a Palette.
 
     Automatically assigns single-character keys based on name initials.
+    Palettes are immutable, so repeated lookups share one instance (and its
+    lazily built render tables).
     """
     name_lower = name.lower()
     if name_lower not in _PRESET_PALETTES:
@@ -137,11 +146,20 @@ def get_preset_palette(name: str) -> Palette:
             f"Unknown preset palette {name!r}. "
             f"Available: {', '.join(list_preset_palettes())}"
         )
-    colors = _PRESET_PALETTES[name_lower]
+    # Keyed by the colors, so edits to the preset dicts are still picked up.
+    # Normalize values the way Palette does, so hex strings work too.
+    return _preset_palette(tuple(
+        hex_to_color(value) if isinstance(value, str) else tuple(value)
+        for value in _PRESET_PALETTES[name_lower].values()
+    ))
+
+
+@lru_cache(maxsize=None)
+def _preset_palette(colors: Tuple[Color, ...]) -> Palette:
     # Assign characters: digits 0-9, then a-z, then A-Z
     chars = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
     mapping: Dict[str, Color | str] = {}
-    for i, (_, color) in enumerate(colors.items()):
+    for i, color in enumerate(colors):
         if i >= len(chars):
             break
         mapping[chars[i]] = color
@@ -160,6 +178,19 @@ class OutlineStyle(Enum):
     SELECTIVE = "selective"
 
 
+# (dx, dy) neighbours that receive outline color around each opaque pixel
+_OUTLINE_OFFSETS: Dict[OutlineStyle, Tuple[Tuple[int, int], ...]] = {
+    OutlineStyle.THIN: ((0, -1), (0, 1), (-1, 0), (1, 0)),
+    OutlineStyle.THICK: (
+        (-1, -1), (0, -1), (1, -1),
+        (-1, 0),           (1, 0),
+        (-1, 1),  (0, 1),  (1, 1),
+    ),
+    # Only outline bottom and right for a shadow-like effect
+    OutlineStyle.SELECTIVE: ((1, 0), (0, 1), (1, 1)),
+}
+
+
 def apply_outline(
     sprite: Sprite,
     color: Color = BLACK,
@@ -171,43 +202,44 @@ def apply_outline(
 
     w, h = sprite.width, sprite.height
 
-    if style == OutlineStyle.THIN:
-        offsets = [(0, -1), (0, 1), (-1, 0), (1, 0)]
-    elif style == OutlineStyle.THICK:
-        offsets = [
-            (-1, -1), (0, -1), (1, -1),
-            (-1, 0),           (1, 0),
-            (-1, 1),  (0, 1),  (1, 1),
-        ]
-    elif style == OutlineStyle.SELECTIVE:
-        # Only outline bottom and right for a shadow-like effect
-        offsets = [(1, 0), (0, 1), (1, 1)]
-    else:
+    offsets = _OUTLINE_OFFSETS.get(style)
+    if offsets is None:
         raise ValueError(f"Unknown outline style: {style!r}")
 
     # Expand canvas by 2 in each direction for outline room
     new_w = w + 2
     new_h = h + 2
-    pixels: list[list[Color]] = [[TRANSPARENT] * new_w for _ in range(new_h)]
+
+    if np is not None:
+        src = np.asarray(sprite.buffer())
+        opaque = src[:, :, 3] > 0
+        out = np.zeros((new_h, new_w, 4), dtype=np.uint8)
+        # Outline first: every neighbour of an opaque pixel
+        ring = np.zeros((new_h, new_w), dtype=bool)
+        for dx, dy in offsets:
+            ring[1 + dy : 1 + dy + h, 1 + dx : 1 + dx + w] |= opaque
+        out[ring] = color
+        # Original pixels on top (offset by 1,1)
+        out[1:-1, 1:-1][opaque] = src[opaque]
+        return Sprite._from_array(out)
+
+    src_px = memoryview(sprite._buf).cast("I")
+    opaque_idx = [i for i, a in enumerate(sprite._buf[3::4]) if a]
+    out_px = array("I", bytes(new_w * new_h * 4))
 
     # Draw outline first
-    for y in range(h):
-        for x in range(w):
-            if sprite.get_pixel(x, y)[3] > 0:
-                for dx, dy in offsets:
-                    nx, ny = x + 1 + dx, y + 1 + dy
-                    if 0 <= nx < new_w and 0 <= ny < new_h:
-                        if pixels[ny][nx][3] == 0:
-                            pixels[ny][nx] = color
+    ring_px = _pack_pixel(color)
+    steps = [dy * new_w + dx for dx, dy in offsets]
+    for i in opaque_idx:
+        o = (i // w + 1) * new_w + i % w + 1
+        for step in steps:
+            out_px[o + step] = ring_px
 
     # Draw original pixels on top (offset by 1,1)
-    for y in range(h):
-        for x in range(w):
-            px = sprite.get_pixel(x, y)
-            if px[3] > 0:
-                pixels[y + 1][x + 1] = px
+    for i in opaque_idx:
+        out_px[(i // w + 1) * new_w + i % w + 1] = src_px[i]
 
-    return Sprite(pixels, _skip_copy=True)
+    return Sprite._from_bytes(out_px.tobytes(), new_w, new_h)
 
 
 # ---------------------------------------------------------------------------
@@ -235,26 +267,32 @@ def apply_shadow(
     new_w = max_x - min_x
     new_h = max_y - min_y
 
-    pixels: list[list[Color]] = [[TRANSPARENT] * new_w for _ in range(new_h)]
-
     # Sprite origin in new canvas
     sx = -min_x
     sy = -min_y
 
+    w, h = sprite.width, sprite.height
+    if np is not None:
+        src = np.asarray(sprite.buffer())
+        opaque = src[:, :, 3] > 0
+        out = np.zeros((new_h, new_w, 4), dtype=np.uint8)
+        out[sy + oy : sy + oy + h, sx + ox : sx + ox + w][opaque] = shadow_rgba
+        out[sy : sy + h, sx : sx + w][opaque] = src[opaque]
+        return Sprite._from_array(out)
+
+    src_px = memoryview(sprite._buf).cast("I")
+    opaque_idx = [i for i, a in enumerate(sprite._buf[3::4]) if a]
+    out_px = array("I", bytes(new_w * new_h * 4))
+
     # Draw shadow
-    for y in range(sprite.height):
-        for x in range(sprite.width):
-            if sprite.get_pixel(x, y)[3] > 0:
-                nx = sx + x + ox
-                ny = sy + y + oy
-                if 0 <= nx < new_w and 0 <= ny < new_h:
-                    pixels[ny][nx] = shadow_rgba
+    shadow_px = _pack_pixel(shadow_rgba)
+    shadow_origin = (sy + oy) * new_w + sx + ox
+    for i in opaque_idx:
+        out_px[shadow_origin + (i // w) * new_w + i % w] = shadow_px
 
     # Draw sprite on top
-    for y in range(sprite.height):
-        for x in range(sprite.width):
-            px = sprite.get_pixel(x, y)
-            if px[3] > 0:
-                pixels[sy + y][sx + x] = px
+    origin = sy * new_w + sx
+    for i in opaque_idx:
+        out_px[origin + (i // w) * new_w + i % w] = src_px[i]
 
-    return Sprite(pixels, _skip_copy=True)
+    return Sprite._from_bytes(out_px.tobytes(), new_w, new_h)
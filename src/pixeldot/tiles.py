@@ -5,7 +5,19 @@ from __future__ import annotations
 import textwrap
 from typing import Dict, List, Optional, Tuple, Union
 
-from .sprite import Sprite
+try:
+    import numpy as np
+except ImportError:  # optional — pip install pixeldot[perf]
+    np = None
+
+from .sprite import Sprite, _composite_into
+
+
+def _blank_cell(tile: Sprite, tw: int, th: int) -> bytearray:
+    """A tw x th RGBA cell holding ``tile`` composited onto transparency."""
+    cell = bytearray(tw * th * 4)
+    _composite_into(cell, tw, th, tile, 0, 0)
+    return cell
 
 
 class TileSet:
@@ -51,12 +63,42 @@ class TileSet:
 
         self._tiles = dict(tiles)
         self._tile_size = (tw, th)
+        self._cells: Optional[Tuple["np.ndarray", "np.ndarray"]] = None
+        # Keys as latin-1 bytes, for checking whole grids with bytes.translate
+        self._key_bytes = bytes(ord(k) for k in self._tiles if ord(k) < 256)
 
     @property
     def tile_size(self) -> Tuple[int, int]:
         """(width, height) of each tile in pixels."""
         return self._tile_size
 
+    def _cell_stack(self) -> Tuple["np.ndarray", "np.ndarray"]:
+        """(sorted key code points, matching (N, th, tw) uint32 cells). Cached.
+
+        Every tile composited onto a blank cell, stored tile-major so each
+        cell is one contiguous run. Requires NumPy.
+        """
+        if self._cells is None:
+            tw, th = self._tile_size
+            keys = sorted(self._tiles)
+            cells = np.empty((len(keys), th, tw), dtype=np.uint32)
+            for i, key in enumerate(keys):
+                cells[i] = np.frombuffer(
+                    _blank_cell(self._tiles[key], tw, th), dtype=np.uint32
+                ).reshape(th, tw)
+            codes = np.array([ord(key) for key in keys], dtype=np.uint32)
+            self._cells = (codes, cells)
+        return self._cells
+
+    def _covers(self, text: str) -> bool:
+        """True if every character of ``text`` is a tile key."""
+        try:
+            data = text.encode("latin-1")
+        except UnicodeEncodeError:
+            return set(text) <= self._tiles.keys()
+        # Deleting every key byte in C leaves nothing iff all chars are keys
+        return not data.translate(None, self._key_bytes)
+
     def __getitem__(self, key: str) -> Sprite:
         try:
             return self._tiles[key]
@@ -107,6 +149,17 @@ class TileMap:
             raise ValueError("TileMap grid is empty")
 
         width = len(rows[0])
+        if len(set(map(len, rows))) != 1 or not tileset._covers("".join(rows)):
+            self._raise_invalid(tileset, rows, width)
+
+        self._rows = rows
+        self._cols = width
+        self._nrows = len(rows)
+        self._sprite: Optional[Sprite] = None
+
+    @staticmethod
+    def _raise_invalid(tileset: TileSet, rows: List[str], width: int) -> None:
+        """Report the first ragged row or unknown tile, scanning in grid order."""
         for i, row in enumerate(rows):
             if len(row) != width:
                 raise ValueError(
@@ -119,10 +172,6 @@ class TileMap:
                         f"Character {ch!r} at grid ({j}, {i}) not in TileSet"
                     )
 
-        self._rows = rows
-        self._cols = width
-        self._nrows = len(rows)
-
     @staticmethod
     def _parse_block(block: str) -> List[str]:
         """Parse a triple-quoted block string, matching StringCanvas.render_block."""
@@ -146,15 +195,42 @@ class TileMap:
         return (self._cols * tw, self._nrows * th)
 
     def to_sprite(self) -> Sprite:
-        """Render the full map by composing tiles into a single Sprite."""
+        """Render the full map by composing tiles into a single Sprite.
+
+        The map and its tiles never change, so the result is rendered once
+        and shared by later calls.
+        """
+        if self._sprite is None:
+            self._sprite = self._render()
+        return self._sprite
+
+    def _render(self) -> Sprite:
         tw, th = self._tileset.tile_size
         pw, ph = self.pixel_size
-        result = Sprite.empty(pw, ph)
-        for gy, row in enumerate(self._rows):
-            for gx, ch in enumerate(row):
-                tile = self._tileset[ch]
-                result = result.paste(tile, gx * tw, gy * th)
-        return result
+        tiles = self._tileset._tiles
+        # Cells never overlap and the canvas starts transparent, so each
+        # distinct tile is composited onto a blank cell once and then reused
+        # for every cell that shows it.
+        if np is not None:
+            # Gather whole cells as uint32 pixels by grid index, then
+            # interleave cell rows with one axis swap
+            keys, cells = self._tileset._cell_stack()
+            codes = np.frombuffer("".join(self._rows).encode("utf-32-le"), dtype="<u4")
+            index = np.searchsorted(keys, codes).reshape(self._nrows, self._cols)
+            grid = cells[index].swapaxes(1, 2)
+            return Sprite._from_bytes(grid.tobytes(), pw, ph)
+
+        stride = tw * 4
+        tile_rows: Dict[str, List[bytes]] = {}
+        for ch in set("".join(self._rows)):
+            cell = _blank_cell(tiles[ch], tw, th)
+            tile_rows[ch] = [bytes(cell[o : o + stride]) for o in range(0, len(cell), stride)]
+        data = b"".join(
+            b"".join([tile_rows[ch][ty] for ch in row])
+            for row in self._rows
+            for ty in range(th)
+        )
+        return Sprite._from_bytes(data, pw, ph)
 
     def __repr__(self) -> str:
         cols, rows = self.grid_size
@@ -19,6 +19,27 @@ def canvas(basic_palette):
     return px.StringCanvas(basic_palette)
 
 
+class TestHexToColor:
+    @pytest.mark.parametrize("hex_str, expected", [
+        ("#F80", (255, 136, 0, 255)),
+        ("#F808", (255, 136, 0, 136)),
+        ("#FF8800", (255, 136, 0, 255)),
+        ("ff880080", (255, 136, 0, 128)),
+    ])
+    def test_formats(self, hex_str, expected):
+        assert px.hex_to_color(hex_str) == expected
+
+    @pytest.mark.parametrize("hex_str", ["#FF", "#GG0000", "#FF 00 0", "#F 0", "FF 00 00"])
+    def test_invalid(self, hex_str):
+        with pytest.raises(ValueError, match="Invalid hex color"):
+            px.hex_to_color(hex_str)
+
+    @pytest.mark.parametrize("color", [(255, 136, 0, 128), [255, 136, 0, 128]])
+    def test_color_to_hex(self, color):
+        assert px.color_to_hex(color) == "#FF880080"
+        assert px.color_to_hex(px.WHITE) == "#FFFFFF"
+
+
 class TestRender:
     def test_simple_render(self, canvas):
         sprite = canvas.render([
@@ -48,6 +69,31 @@ class TestRender:
         with pytest.raises(KeyError, match="not in palette"):
             canvas.render(["KxK"])
 
+    def test_unknown_character_reports_position(self, canvas):
+        with pytest.raises(KeyError, match=r"'x' at \(2, 1\)"):
+            canvas.render(["KKK", "KKx"])
+
+    def test_non_latin1_character_raises(self, canvas):
+        with pytest.raises(KeyError, match="not in palette"):
+            canvas.render(["K\u2588K"])
+
+    def test_non_latin1_palette_key(self):
+        p = px.Palette({'\u2588': px.BLACK, '.': px.TRANSPARENT})
+        sprite = px.StringCanvas(p).render(["\u2588."])
+        assert sprite.get_pixel(0, 0) == px.BLACK
+        assert sprite.get_pixel(1, 0) == px.TRANSPARENT
+
+    def test_pure_python_fallback(self, basic_palette, monkeypatch):
+        from pixeldot import color
+
+        rows = ["KrK", ".W."]
+        expected = px.StringCanvas(basic_palette).render(rows)
+        monkeypatch.setattr(color, "np", None)
+        palette = px.Palette(dict(basic_palette.items()))
+        assert px.StringCanvas(palette).render(rows) == expected
+        with pytest.raises(KeyError, match=r"'x' at \(1, 1\)"):
+            px.StringCanvas(palette).render(["KK", "Kx"])
+
     def test_empty_rows_raises(self, canvas):
         with pytest.raises(ValueError):
             canvas.render([])
@@ -69,6 +115,11 @@ class TestRenderBlock:
         """)
         assert sprite.size == (3, 1)
 
+    def test_flush_left_block(self, canvas):
+        sprite = canvas.render_block("\nKr\n.K\n")
+        assert sprite.size == (2, 2)
+        assert sprite.get_pixel(0, 1) == px.TRANSPARENT
+
     def test_empty_block_raises(self, canvas):
         with pytest.raises(ValueError):
             canvas.render_block("   \n   \n   ")
@@ -85,3 +136,63 @@ class TestToString:
         sprite = px.Sprite([[(128, 128, 128, 255)]])
         with pytest.raises(KeyError):
             px.StringCanvas.to_string(sprite, basic_palette)
+
+    def test_non_latin1_keys_and_duplicates(self, monkeypatch):
+        from pixeldot import color
+
+        p = px.Palette({'.': px.TRANSPARENT, '漢': px.BLACK, 'K': px.BLACK, 'é': '#FF0000'})
+        sprite = px.StringCanvas(p).render(["漢.é", "Ké."])
+        expected = ["漢.é", "漢é."]  # first key wins for a shared color
+        assert px.StringCanvas.to_string(sprite, p) == expected
+        monkeypatch.setattr(color, "np", None)
+        assert px.StringCanvas.to_string(sprite, px.Palette(dict(p.items()))) == expected
+
+    def test_fallback_lookup_cached(self, basic_palette, monkeypatch):
+        from pixeldot import color
+
+        monkeypatch.setattr(color, "np", None)
+        sprite = px.StringCanvas(basic_palette).render(["K.", ".W"])
+        assert px.StringCanvas.to_string(sprite, basic_palette) == ["K.", ".W"]
+        lookup = basic_palette._word_lookup()
+        assert px.StringCanvas.to_string(sprite, basic_palette) == ["K.", ".W"]
+        assert basic_palette._word_lookup() is lookup
+
+    @pytest.mark.parametrize("bad", [(300, 0, 0, 255), (-1, 0, 0, 255)])
+    def test_out_of_range_palette_color(self, bad):
+        p = px.Palette({'a': bad, 'b': (1, 2, 3, 255)})
+        sprite = px.Sprite([[(1, 2, 3, 255)]])
+        assert px.StringCanvas.to_string(sprite, p) == ['b']
+
+    def test_large_palette_vectorized(self):
+        pytest.importorskip("numpy")
+        keys = [chr(0x4E00 + i) for i in range(1000)]
+        p = px.Palette({k: (i % 256, i // 256, 7, 255) for i, k in enumerate(keys)})
+        rows = ["".join(keys[i : i + 40]) for i in range(0, 1000, 40)]
+        sprite = px.StringCanvas(p).render(rows)
+        assert p._reverse_table() is not None
+        assert px.StringCanvas.to_string(sprite, p) == rows
+
+    def test_fallback_skips_out_of_range_colors(self, monkeypatch):
+        from pixeldot import color
+
+        monkeypatch.setattr(color, "np", None)
+        sprite = px.Sprite([[(1, 2, 3, 255)]])
+        for bad in [(300, 0, 0, 255), (-1, 0, 0, 255)]:
+            p = px.Palette({'a': bad, 'b': (1, 2, 3, 255)})
+            assert px.StringCanvas.to_string(sprite, p) == ['b']
+
+
+class TestPalette:
+    def test_reverse_lookup(self, basic_palette):
+        assert basic_palette.reverse_lookup(px.BLACK) == 'K'
+        assert basic_palette.reverse_lookup((255, 0, 0, 255)) == 'r'
+        assert basic_palette.reverse_lookup((1, 2, 3, 255)) is None
+
+    def test_reverse_lookup_duplicate_color_keeps_first_key(self):
+        p = px.Palette({'a': px.BLACK, 'b': px.BLACK})
+        assert p.reverse_lookup(px.BLACK) == 'a'
+
+    def test_reverse_lookup_after_with_updates(self, basic_palette):
+        updated = basic_palette.with_updates(r='#00FF00')
+        assert updated.reverse_lookup((0, 255, 0, 255)) == 'r'
+        assert updated.reverse_lookup((255, 0, 0, 255)) is None
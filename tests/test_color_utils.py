@@ -45,6 +45,30 @@ class TestHSLConversion:
         assert s == pytest.approx(0.0, abs=0.01)
         assert l == pytest.approx(0.502, abs=0.01)
 
+    def test_fast_paths_match_general(self, monkeypatch):
+        from pixeldot import color_utils
+
+        fast = {rgb: px.rgb_to_hsl((*rgb, 255)) for rgb in color_utils._PRIMARY_HSL}
+        monkeypatch.setattr(color_utils, "_PRIMARY_HSL", {})
+        for rgb, hsl in fast.items():
+            assert color_utils._rgb_to_hsl.__wrapped__((*rgb, 255)) == hsl
+        assert px.rgb_to_hsl((77, 77, 77, 255)) == (0.0, 0.0, 77 / 255.0)
+
+    def test_cached(self):
+        from pixeldot import color_utils
+
+        color_utils._rgb_to_hsl.cache_clear()
+        first = px.rgb_to_hsl((200, 100, 50, 255))
+        assert px.rgb_to_hsl((200, 100, 50, 255)) is first
+        assert color_utils._rgb_to_hsl.cache_info().hits == 1
+
+    def test_list_color(self):
+        color = [200, 100, 50, 255]
+        assert px.rgb_to_hsl(color) == px.rgb_to_hsl(tuple(color))
+        assert px.lighten(color) == px.lighten(tuple(color))
+        assert px.desaturate(color) == px.desaturate(tuple(color))
+        assert px.auto_shades(color, 3) == px.auto_shades(tuple(color), 3)
+
     def test_preserves_alpha(self):
         result = px.hsl_to_rgb(0, 1.0, 0.5, 128)
         assert result[3] == 128
@@ -125,6 +149,11 @@ class TestColorRamp:
         with pytest.raises(ValueError):
             px.color_ramp(px.BLACK, px.WHITE, 1)
 
+    def test_matches_color_lerp(self):
+        start, end = (10, 200, 33, 255), (250, 3, 128, 0)
+        ramp = px.color_ramp(start, end, 9)
+        assert ramp == [px.color_lerp(start, end, i / 8) for i in range(9)]
+
 
 class TestAutoShades:
     def test_count(self):
@@ -142,6 +171,15 @@ class TestAutoShades:
         with pytest.raises(ValueError):
             px.auto_shades(px.BLACK, count=1)
 
+    def test_pure_python_fallback(self, monkeypatch):
+        from pixeldot import color_utils
+
+        base = (200, 50, 50, 128)
+        expected = px.auto_shades(base, count=7)
+        monkeypatch.setattr(color_utils, "np", None)
+        assert px.auto_shades(base, count=7) == expected
+        assert all(c[3] == 128 for c in expected)
+
 
 class TestDitherPattern:
     def test_checker(self):
@@ -160,6 +198,48 @@ class TestDitherPattern:
         with pytest.raises(ValueError, match="Unknown dither"):
             px.dither_pattern(px.BLACK, px.WHITE, "spiral")
 
+    def test_returns_fresh_list(self):
+        pattern = px.dither_pattern(px.BLACK, px.WHITE, "checker")
+        pattern[0][0] = False
+        assert px.dither_pattern(px.BLACK, px.WHITE, "checker")[0][0] is True
+
+    def test_fill(self):
+        red = (255, 0, 0, 128)
+        for name in ("checker", "horizontal", "vertical"):
+            pattern = px.dither_pattern(red, px.BLACK, name)
+            sprite = px.dither_fill(5, 3, red, px.BLACK, name)
+            assert sprite.size == (5, 3)
+            for y in range(3):
+                for x in range(5):
+                    expected = red if pattern[y % 2][x % 2] else px.BLACK
+                    assert sprite.get_pixel(x, y) == expected
+        with pytest.raises(ValueError, match="Unknown dither"):
+            px.dither_fill(2, 2, red, px.BLACK, "spiral")
+
+
+class TestDitherMask:
+    def test_matches_pattern(self):
+        numpy = pytest.importorskip("numpy")
+        for name in ("checker", "horizontal", "vertical"):
+            mask = px.dither_mask(name)
+            assert mask.dtype == numpy.uint8
+            assert mask.tolist() == [
+                [int(v) for v in row]
+                for row in px.dither_pattern(px.BLACK, px.WHITE, name)
+            ]
+
+    def test_cached_and_read_only(self):
+        pytest.importorskip("numpy")
+        mask = px.dither_mask("checker")
+        assert px.dither_mask("checker") is mask
+        with pytest.raises(ValueError):
+            mask[0, 0] = 0
+
+    def test_unknown_raises(self):
+        pytest.importorskip("numpy")
+        with pytest.raises(ValueError, match="Unknown dither"):
+            px.dither_mask("spiral")
+
 
 class TestColorDistance:
     def test_same_color(self):
@@ -173,3 +253,60 @@ class TestColorDistance:
         c1 = (100, 50, 200, 255)
         c2 = (50, 100, 100, 255)
         assert px.color_distance(c1, c2) == px.color_distance(c2, c1)
+
+    def test_squared(self):
+        c1 = (10, 20, 30, 255)
+        c2 = (13, 24, 30, 255)
+        assert px.color_distance_sq(c1, c2) == 25
+        assert px.color_distance(c1, c2) == 5.0
+
+    def test_redmean(self):
+        c1 = (100, 50, 200, 255)
+        c2 = (50, 100, 100, 0)
+        assert px.color_distance_redmean(c1, c1) == 0.0
+        assert px.color_distance_redmean(c1, c2) == px.color_distance_redmean(c2, c1)
+        # Green differences weigh more than equal blue ones
+        dark = (0, 0, 0, 255)
+        assert px.color_distance_redmean(dark, (0, 40, 0, 255)) > px.color_distance_redmean(
+            dark, (0, 0, 40, 255)
+        )
+        assert px.color_distance_redmean(px.BLACK, px.WHITE) == pytest.approx(765.0, abs=1.5)
+
+
+class TestNearestColor:
+    def test_nearest(self):
+        colors = [px.BLACK, px.WHITE, (200, 0, 0, 255)]
+        assert px.nearest_color((180, 20, 10, 255), colors) == (200, 0, 0, 255)
+        assert px.nearest_color((20, 20, 20, 255), colors) == px.BLACK
+
+    def test_tie_prefers_first(self):
+        colors = [(0, 0, 0, 255), (2, 0, 0, 255)]
+        assert px.nearest_color((1, 0, 0, 255), colors) == (0, 0, 0, 255)
+
+    def test_empty_raises(self):
+        with pytest.raises(ValueError):
+            px.nearest_color(px.BLACK, [])
+
+    def test_pure_python_fallback(self, monkeypatch):
+        from pixeldot import color_utils
+
+        monkeypatch.setattr(color_utils, "np", None)
+        colors = [px.BLACK, px.WHITE, (200, 0, 0, 255)]
+        assert px.nearest_color((180, 20, 10, 255), colors) == (200, 0, 0, 255)
+
+
+class TestNearestColors:
+    def test_matches_nearest_color(self, monkeypatch):
+        from pixeldot import color_utils
+
+        colors = [(0, 0, 0, 255), (2, 0, 0, 255), px.WHITE, (200, 0, 0, 255)]
+        targets = [(1, 0, 0, 255), (180, 20, 10, 255), px.TRANSPARENT, (1, 0, 0, 255)]
+        expected = [px.nearest_color(t, colors) for t in targets]
+        assert px.nearest_colors(targets, colors) == expected
+        monkeypatch.setattr(color_utils, "np", None)
+        assert px.nearest_colors(targets, colors) == expected
+
+    def test_empty(self):
+        assert px.nearest_colors([], [px.BLACK]) == []
+        with pytest.raises(ValueError):
+            px.nearest_colors([px.BLACK], [])
@@ -55,6 +55,29 @@ class TestMultiCharPalette:
         with pytest.raises(KeyError):
             p.render(["cd"])
 
+    def test_unknown_key_reports_position(self):
+        p = MultiCharPalette({'ab': px.BLACK, 'cd': px.WHITE}, key_length=2)
+        with pytest.raises(KeyError, match=r"'ba' at pixel \(1, 1\)"):
+            p.render(["abcd", "abba"])
+        with pytest.raises(KeyError, match=r"'é!' at pixel \(0, 0\)"):
+            p.render(["é!"])
+
+    def test_pure_python_fallback(self, monkeypatch):
+        from pixeldot import extended_palette
+
+        mapping = {'..': px.TRANSPARENT, 'K1': px.BLACK, 'r1': '#FF0000'}
+        rows = ["..K1r1", "r1K1.."]
+        expected = MultiCharPalette(mapping).render(rows)
+        monkeypatch.setattr(extended_palette, "np", None)
+        assert MultiCharPalette(mapping).render(rows) == expected
+        with pytest.raises(KeyError, match=r"'xx' at pixel \(2, 0\)"):
+            MultiCharPalette(mapping).render(["..K1xx"])
+
+    def test_three_char_keys(self):
+        p = MultiCharPalette({'abc': px.BLACK, 'xyz': px.WHITE}, key_length=3)
+        sprite = p.render(["abcxyz"])
+        assert sprite.get_pixel(1, 0) == px.WHITE
+
     def test_empty_rows_raises(self):
         p = MultiCharPalette({'ab': px.BLACK}, key_length=2)
         with pytest.raises(ValueError):
@@ -95,6 +118,30 @@ class TestMultiCharPalette:
         with pytest.raises(KeyError):
             p.to_string(sprite)
 
+    def test_to_string_missing_color_reports_position(self):
+        p = MultiCharPalette({'KK': px.BLACK}, key_length=2)
+        sprite = px.Sprite([[px.BLACK, px.BLACK], [px.BLACK, px.WHITE]])
+        with pytest.raises(KeyError, match=r"\(255, 255, 255, 255\) at \(1, 1\)"):
+            p.to_string(sprite)
+
+    def test_to_string_pure_python_fallback(self, monkeypatch):
+        from pixeldot import color
+
+        keys = [a + b for a in "abcdefghij" for b in "0123456789"]
+        colors = [(i, 255 - i, i * 2 % 256, 255) for i in range(len(keys))]
+        rows = ["".join(keys[(x * 7 + y) % len(keys)] for x in range(16)) for y in range(5)]
+        p = MultiCharPalette(dict(zip(keys, colors)))
+        sprite = p.render(rows)
+        assert p.to_string(sprite) == rows
+        monkeypatch.setattr(color, "np", None)
+        assert MultiCharPalette(dict(zip(keys, colors))).to_string(sprite) == rows
+
+    def test_reverse_lookup_first_key_wins(self):
+        p = MultiCharPalette({'k1': px.BLACK, 'k2': px.BLACK, 'w1': [255, 255, 255, 255]})
+        assert p.reverse_lookup(px.BLACK) == 'k1'
+        assert p.reverse_lookup(px.WHITE) == 'w1'
+        assert p.reverse_lookup((1, 2, 3, 255)) is None
+
     def test_contains_and_len(self):
         p = MultiCharPalette({'ab': px.BLACK, 'cd': px.WHITE}, key_length=2)
         assert 'ab' in p
@@ -166,3 +213,34 @@ class TestAutoPalette:
         # Round-trip
         reconstructed = palette.render(rows)
         assert original == reconstructed
+
+    def test_from_sprite_tie_order(self):
+        """Equal counts keep first-seen order."""
+        pixels = [[px.WHITE, px.BLACK, px.BLACK, px.WHITE, (255, 0, 0, 255)]]
+        palette, rows = AutoPalette.from_sprite(px.Sprite(pixels))
+        assert rows == ["abbac"]
+        assert palette['a'] == px.WHITE
+
+    def test_pure_python_fallback(self, monkeypatch):
+        from pixeldot import extended_palette
+
+        colors = [(i, i * 3 % 256, i * 7 % 256, 255) for i in range(70)]
+        pixels = [colors[i:i+10] for i in range(0, 70, 10)]
+        for sprite in (px.Sprite(pixels), px.Sprite(pixels[:2]).crop(0, 0, 4, 2)):
+            palette, rows = AutoPalette.from_sprite(sprite)
+            monkeypatch.setattr(extended_palette, "np", None)
+            fb_palette, fb_rows = AutoPalette.from_sprite(sprite)
+            monkeypatch.undo()
+            assert fb_rows == rows
+            assert dict(fb_palette.items()) == dict(palette.items())
+
+    def test_from_sprite_too_many_colors_raises(self):
+        colors = [(i % 256, i // 256, 0, 255) for i in range(62 * 62 + 1)]
+        with pytest.raises(ValueError, match="3845 colors"):
+            AutoPalette.from_sprite(px.Sprite([colors]))
+
+    def test_from_sprite_two_char_key_order(self):
+        colors = [(i, 0, 0, 255) for i in range(64)]
+        palette, rows = AutoPalette.from_sprite(px.Sprite([colors]))
+        assert rows[0].startswith("aaabac")
+        assert rows[0].endswith("a9babb")
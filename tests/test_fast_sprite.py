@@ -52,6 +52,17 @@ class TestConversion:
         back = fs.to_sprite()
         assert back == sprite
 
+    def test_from_sprite_is_writable_copy(self):
+        sprite = make_sprite(["Kr"])
+        fs = FastSprite.from_sprite(sprite)
+        fs._data[0, 0] = (1, 2, 3, 4)
+        assert sprite.get_pixel(0, 0) == px.BLACK
+
+    def test_to_sprite_from_strided_view(self):
+        fs = FastSprite.from_sprite(make_sprite(["Kr", "rK"]))
+        view = FastSprite(fs._data[:, ::-1])
+        assert view.to_sprite() == make_sprite(["rK", "Kr"])
+
     def test_image_round_trip(self):
         fs = FastSprite.from_sprite(make_sprite(["Kr", "rK"]))
         img = fs.to_image()
@@ -92,6 +103,52 @@ class TestTransforms:
         assert result.get_pixel(0, 0) == px.BLACK
         assert result.get_pixel(1, 0) == (255, 0, 0, 255)
 
+    def test_paste_semi_transparent_matches_sprite(self):
+        bg = make_sprite(["KK", "rK"])
+        overlay = px.Sprite([
+            [(255, 0, 0, 128), (0, 0, 255, 1)],
+            [(0, 255, 0, 200), (10, 20, 30, 0)],
+        ])
+        expected = bg.paste(overlay, 0, 0)
+        fs = FastSprite.from_sprite(bg).paste(FastSprite.from_sprite(overlay), 0, 0)
+        assert fs.to_sprite() == expected
+        assert fs.get_pixel(0, 0) == (128, 0, 0, 255)
+
+    def test_paste_onto_transparent_matches_sprite(self):
+        bg = px.Sprite([[(5, 5, 5, 0), (5, 5, 5, 0)]])
+        overlay = px.Sprite([[(0, 0, 0, 0), (9, 9, 9, 128)]])
+        fs = FastSprite.from_sprite(bg).paste(FastSprite.from_sprite(overlay), 0, 0)
+        assert fs.to_sprite() == bg.paste(overlay, 0, 0)
+        assert fs.get_pixel(0, 0) == (5, 5, 5, 0)
+        canvas = FastSprite.from_sprite(bg)
+        canvas.paste_inplace(FastSprite.from_sprite(overlay), 0, 0)
+        assert canvas == fs
+
+    @pytest.mark.parametrize("neighbour_alpha", [0, 255, 77])
+    def test_clear_pixel_independent_of_tile_alpha(self, neighbour_alpha):
+        # Binary-alpha and mixed-alpha tiles take different paths; both must
+        # leave the destination under a clear source pixel as Sprite does
+        bg = px.Sprite([[(5, 6, 7, 0), (1, 2, 3, 0), (0, 0, 0, 0)]])
+        overlay = px.Sprite([[(0, 0, 0, 0), (9, 9, 9, neighbour_alpha), (4, 4, 4, 0)]])
+        fs = FastSprite.from_sprite(bg).paste(FastSprite.from_sprite(overlay), 0, 0)
+        assert fs.to_sprite() == bg.paste(overlay, 0, 0)
+        assert fs.get_pixel(0, 0) == (5, 6, 7, 0)
+
+    @pytest.mark.parametrize("x, y", [(1, 1), (-1, 2), (3, -1), (0, 0), (2, 3)])
+    def test_paste_offsets_match_sprite(self, x, y):
+        bg = make_sprite(["KrKr", "g..g", "rKrK", "..gg"])
+        fg = make_sprite(["rg", ".K"])
+        fs = FastSprite.from_sprite(bg).paste(FastSprite.from_sprite(fg), x, y)
+        assert fs.to_sprite() == bg.paste(fg, x, y)
+
+    def test_paste_inplace(self):
+        canvas = FastSprite.empty(3, 1)
+        dot = FastSprite.from_sprite(make_sprite(["r"]))
+        canvas.paste_inplace(dot, 2, 0)
+        canvas.paste_inplace(dot, 9, 0)
+        assert canvas.get_pixel(2, 0) == (255, 0, 0, 255)
+        assert canvas.get_pixel(0, 0) == (0, 0, 0, 0)
+
     def test_paste_out_of_bounds(self):
         bg = FastSprite.empty(2, 2)
         dot = FastSprite.from_sprite(make_sprite(["r"]))
@@ -116,6 +173,14 @@ class TestTransforms:
         assert replaced.get_pixel(0, 0) == (255, 0, 0, 255)
         assert replaced.get_pixel(1, 0) == (255, 0, 0, 255)
 
+    def test_replace_color_whole_pixels_only(self):
+        fs = FastSprite.from_sprite(make_sprite(["Kr", "rK"]))
+        view = FastSprite(fs._data[:, ::-1])  # non-contiguous input
+        replaced = view.replace_color((255, 0, 0, 255), (1, 2, 3, 4))
+        assert replaced.get_pixel(0, 0) == (1, 2, 3, 4)
+        assert replaced.get_pixel(1, 0) == px.BLACK
+        assert fs.get_pixel(1, 0) == (255, 0, 0, 255)
+
     def test_trim(self):
         fs = FastSprite.from_sprite(make_sprite(["...", ".K.", "..."]))
         trimmed = fs.trim()
@@ -134,6 +199,10 @@ class TestBounds:
         bounds = fs.opaque_bounds()
         assert bounds == (1, 1, 2, 1)
 
+    def test_opaque_bounds_matches_sprite(self):
+        sprite = make_sprite(["....r", ".K...", "r....", "....."])
+        assert FastSprite.from_sprite(sprite).opaque_bounds() == sprite.opaque_bounds()
+
     def test_opaque_bounds_none(self):
         fs = FastSprite.from_sprite(make_sprite(["...", "..."]))
         assert fs.opaque_bounds() is None
@@ -144,6 +144,22 @@ class TestFlatten:
         stack.add_layer("fg", green)
         result = stack.flatten()
         assert result.get_pixel(0, 0) == (0, 255, 0, 255)
+        assert result is green
+
+    def test_flatten_skips_layers_under_opaque(self, monkeypatch):
+        """Layers beneath a fully opaque NORMAL layer cannot show through."""
+        from pixeldot import layers
+
+        stack = LayerStack(2, 2)
+        stack.add_layer("hidden", make_sprite(["rr", "rr"]), blend_mode=BlendMode.SCREEN)
+        stack.add_layer("cover", make_sprite(["gK", "Kg"]))
+        stack.add_layer("tint", solid_sprite((0, 0, 255, 128)), blend_mode=BlendMode.MULTIPLY)
+        stack.add_layer("ghost", make_sprite(["WW", "WW"]), opacity=0.5)
+        expected = stack.flatten()
+        stack.remove_layer("hidden")
+        assert stack.flatten() == expected
+        monkeypatch.setattr(layers, "np", None)
+        assert stack.flatten() == expected
 
     def test_flatten_with_transparency(self):
         """Top layer has transparent pixels, bottom shows through."""
@@ -269,3 +285,38 @@ class TestBlendModes:
         assert pixel[0] == 255
         assert pixel[1] == 0
         assert pixel[2] == 0
+
+    def test_flatten_binary_alpha_normal(self, monkeypatch):
+        """Opaque/clear NORMAL layers take the masked-copy path."""
+        from pixeldot import layers
+
+        pytest.importorskip("numpy")
+        stack = LayerStack(3, 2)
+        stack.add_layer("bg", make_sprite(["KKK", "rrr"]))
+        stack.add_layer("mid", make_sprite([".g.", "b.W"]))
+        stack.add_layer("top", make_sprite(["..W", "..."]))
+        result = stack.flatten()
+        assert result == make_sprite(["KgW", "brW"])
+        monkeypatch.setattr(layers, "np", None)
+        assert stack.flatten() == result
+
+    @pytest.mark.parametrize("mode", list(BlendMode))
+    def test_flatten_matches_scalar_blend(self, mode, monkeypatch):
+        """The NumPy flatten is bit-identical to the per-pixel path."""
+        from pixeldot import layers
+
+        pytest.importorskip("numpy")
+        values = (0, 37, 128, 200, 255)
+        pixels = [
+            [(r, g, 255 - r, a) for r in values for a in values]
+            for g in values
+        ]
+        base = px.Sprite(pixels)
+        top = base.flip_h().flip_v()
+        stack = LayerStack(base.width, base.height)
+        stack.add_layer("bg", base)
+        stack.add_layer("fg", top, opacity=0.6, blend_mode=mode)
+        stack.add_layer("top", base, blend_mode=mode)
+        expected = stack.flatten()
+        monkeypatch.setattr(layers, "np", None)
+        assert stack.flatten() == expected
@@ -1,7 +1,6 @@
 """End-to-end roundtrip tests: string → Sprite → PNG → load → analyze → string."""
 
-import tempfile
-from pathlib import Path
+import hashlib
 
 import pytest
 import pixeldot as px
@@ -19,6 +18,11 @@ def palette():
     })
 
 
+@pytest.fixture
+def canvas(palette):
+    return px.StringCanvas(palette)
+
+
 @pytest.fixture
 def sample_rows():
     return [
@@ -32,38 +36,45 @@ def sample_rows():
 
 
 class TestFullRoundtrip:
-    def test_string_to_png_to_string(self, palette, sample_rows):
+    def test_string_to_png_to_string(self, canvas, palette, sample_rows, tmp_path):
         """Complete roundtrip: string → Sprite → PNG → load → string."""
-        canvas = px.StringCanvas(palette)
         sprite = canvas.render(sample_rows)
 
-        with tempfile.TemporaryDirectory() as tmp:
-            path = Path(tmp) / "test.png"
-            px.save(sprite, path)
+        path = tmp_path / "test.png"
+        px.save(sprite, path)
 
-            loaded = px.load(path)
-            assert sprite == loaded
+        loaded = px.load(path)
+        assert sprite == loaded
 
-            result_rows = px.StringCanvas.to_string(loaded, palette)
-            assert result_rows == sample_rows
+        result_rows = px.StringCanvas.to_string(loaded, palette)
+        assert result_rows == sample_rows
 
-    def test_save_and_load_preview(self, palette, sample_rows):
+    def test_save_and_load_preview(self, canvas, sample_rows, tmp_path):
         """Verify preview save works."""
-        canvas = px.StringCanvas(palette)
         sprite = canvas.render(sample_rows)
 
-        with tempfile.TemporaryDirectory() as tmp:
-            path = Path(tmp) / "preview.png"
-            px.save_preview(sprite, path, scale=4)
+        path = tmp_path / "preview.png"
+        px.save_preview(sprite, path, scale=4)
+
+        loaded = px.load(path)
+        assert loaded.width == sprite.width * 4
+        assert loaded.height == sprite.height * 4
 
-            loaded = px.load(path)
-            assert loaded.width == sprite.width * 4
-            assert loaded.height == sprite.height * 4
+
+    def test_scale_nearest(self, canvas, sample_rows):
+        sprite = canvas.render(sample_rows)
+        for factor in (1, 3, 7):
+            scaled = px.scale_nearest(sprite, factor)
+            assert scaled.size == (sprite.width * factor, sprite.height * factor)
+            for y in range(scaled.height):
+                for x in range(scaled.width):
+                    assert scaled.get_pixel(x, y) == sprite.get_pixel(
+                        x // factor, y // factor
+                    )
 
 
 class TestAnalysisRoundtrip:
-    def test_palette_extraction(self, palette, sample_rows):
-        canvas = px.StringCanvas(palette)
+    def test_palette_extraction(self, canvas, sample_rows):
         sprite = canvas.render(sample_rows)
 
         colors = px.extract_palette(sprite, top_n=10)
@@ -77,27 +88,64 @@ class TestAnalysisRoundtrip:
         assert "#000000" in found_hex
         assert "#FF0000" in found_hex
 
-    def test_color_count(self, palette, sample_rows):
-        canvas = px.StringCanvas(palette)
+    def test_color_count(self, canvas, sample_rows):
         sprite = canvas.render(sample_rows)
         assert px.color_count(sprite) == 4  # K, r, g, b
 
-    def test_pixel_hash_consistency(self, palette, sample_rows):
-        canvas = px.StringCanvas(palette)
+    def test_color_count_max_count(self, canvas, sample_rows, monkeypatch):
+        from pixeldot import analysis
+
+        sprite = canvas.render(sample_rows)
+        for numpy in (analysis.np, None):
+            monkeypatch.setattr(analysis, "np", numpy)
+            assert px.color_count(sprite, max_count=10) == 4
+            assert px.color_count(sprite, max_count=4) == 4
+            assert px.color_count(sprite, max_count=1) > 1
+
+    def test_palette_extraction_tie_order(self, canvas):
+        sprite = canvas.render(["..rgKb", "bgr..K"])
+        colors = px.extract_palette(sprite, top_n=3)
+        # Equal counts keep first-seen (scan) order
+        assert [c.color for c in colors] == [
+            (255, 0, 0, 255), (0, 255, 0, 255), px.BLACK,
+        ]
+        assert colors[0].count == 2
+        assert colors[0].percentage == 25.0
+
+    def test_pure_python_fallback(self, canvas, sample_rows, monkeypatch):
+        from pixeldot import analysis
+
+        sprite = canvas.render(sample_rows)
+
+        def analyze():
+            return (
+                px.extract_palette(sprite),
+                px.color_count(sprite),
+                px.pixel_hash(sprite),
+            )
+
+        expected = analyze()
+        monkeypatch.setattr(analysis, "np", None)
+        assert analyze() == expected
+
+    def test_pixel_hash_consistency(self, canvas, sample_rows):
         s1 = canvas.render(sample_rows)
         s2 = canvas.render(sample_rows)
         assert px.pixel_hash(s1) == px.pixel_hash(s2)
 
-    def test_pixel_hash_differs(self, palette, sample_rows):
-        canvas = px.StringCanvas(palette)
+    def test_pixel_hash_matches_raw_rgba(self, canvas, sample_rows):
+        sprite = canvas.render(sample_rows)
+        raw = sprite.to_image().tobytes()
+        assert px.pixel_hash(sprite) == hashlib.sha256(raw).hexdigest()
+
+    def test_pixel_hash_differs(self, canvas, sample_rows):
         s1 = canvas.render(sample_rows)
         s2 = canvas.render(["KK", "rr"])
         assert px.pixel_hash(s1) != px.pixel_hash(s2)
 
 
 class TestSheetRoundtrip:
-    def test_strip_pack_unpack(self, palette):
-        canvas = px.StringCanvas(palette)
+    def test_strip_pack_unpack(self, canvas):
         f1 = canvas.render(["Kr", "rK"])
         f2 = canvas.render(["rK", "Kr"])
 
@@ -110,8 +158,14 @@ class TestSheetRoundtrip:
         assert unpacked.frames[0] == f1
         assert unpacked.frames[1] == f2
 
-    def test_grid_pack(self, palette):
-        canvas = px.StringCanvas(palette)
+    def test_strip_pack_semi_transparent(self):
+        frame = px.Sprite([[(255, 0, 0, 128), (0, 0, 0, 0)]])
+        packed = px.StripSheet([frame, frame.flip_h()]).to_sprite()
+        empty = px.Sprite.empty(4, 1)
+        expected = empty.paste(frame, 0, 0).paste(frame.flip_h(), 2, 0)
+        assert packed == expected
+
+    def test_grid_pack(self, canvas):
         sprites = {
             "a": canvas.render(["KK", "KK"]),
             "b": canvas.render(["rr", "rr"]),
@@ -129,8 +183,7 @@ class TestSheetRoundtrip:
 
 
 class TestRegionRoundtrip:
-    def test_compose_decompose(self, palette):
-        canvas = px.StringCanvas(palette)
+    def test_compose_decompose(self, canvas):
         layout = px.RegionLayout(
             canvas_size=(4, 4),
             regions=[
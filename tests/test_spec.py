@@ -8,15 +8,21 @@ from pathlib import Path
 import pytest
 import yaml
 
+from pixeldot.io import load
 from pixeldot.spec import Spec, SpecError, load_spec, render_spec
 from pixeldot.color import BLACK, TRANSPARENT, WHITE, Palette
 from pixeldot.sprite import Sprite
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper
+
 
 def _write_spec(tmp_path: Path, data: dict) -> Path:
     """Write a YAML spec to a temp file and return its path."""
     spec_file = tmp_path / "spec.yaml"
-    spec_file.write_text(yaml.dump(data, default_flow_style=False))
+    spec_file.write_text(yaml.dump(data, Dumper=_YamlDumper, default_flow_style=False))
     return spec_file
 
 
@@ -89,6 +95,48 @@ class TestBasicBlock:
         assert (tmp_path / "out" / "dot.png").exists()
         assert (tmp_path / "out" / "dot_10x.png").exists()
 
+    def test_save_all_returns_paths_in_order(self, tmp_path: Path):
+        data = {
+            "palette": {".": "transparent", "K": "black"},
+            "sprites": {
+                name: {"block": "K.", "save": f"out/{name}.png", "preview": f"out/{name}_10x.png"}
+                for name in "abcde"
+            },
+        }
+        spec = load_spec(_write_spec(tmp_path, data))
+        saved = spec.save_all(spec.render())
+        assert saved == [
+            str(tmp_path / "out" / f"{name}{suffix}.png")
+            for name in "abcde"
+            for suffix in ("", "_10x")
+        ]
+        assert all(Path(path).exists() for path in saved)
+
+    @pytest.mark.parametrize("count", [2, 10])
+    def test_save_all_same_path_last_wins(self, tmp_path: Path, count: int):
+        names = [f"s{i}" for i in range(count)]
+        data = {
+            "palette": {"K": "black", "W": "white"},
+            "sprites": {name: {"block": "K", "save": f"{name}.png"} for name in names},
+        }
+        data["sprites"][names[0]]["save"] = "shared.png"
+        data["sprites"][names[-1]] = {"block": "W", "save": "./shared.png"}
+        spec = load_spec(_write_spec(tmp_path, data))
+        saved = spec.save_all(spec.render())
+        assert len(saved) == count
+        assert load(tmp_path / "shared.png").get_pixel(0, 0) == WHITE
+
+    def test_save_all_raises_first_failure(self, tmp_path: Path):
+        (tmp_path / "blocked").write_text("not a directory")
+        data = {
+            "palette": {"K": "black"},
+            "sprites": {f"s{i}": {"block": "K", "save": f"out/s{i}.png"} for i in range(10)},
+        }
+        data["sprites"]["s3"]["save"] = "blocked/s3.png"
+        spec = load_spec(_write_spec(tmp_path, data))
+        with pytest.raises(OSError):
+            spec.save_all(spec.render())
+
 
 # ---------------------------------------------------------------------------
 # Sprite references: strip, grid
@@ -308,6 +356,18 @@ class TestErrors:
         with pytest.raises(SpecError, match="block"):
             spec.render()
 
+    def test_pure_python_loader(self, tmp_path: Path, monkeypatch):
+        from pixeldot import spec as spec_mod
+
+        data = {
+            "palette": {".": "transparent", "K": "#000000"},
+            "sprites": {"dot": {"block": ".K\nK."}},
+        }
+        spec_file = _write_spec(tmp_path, data)
+        expected = render_spec(spec_file, dry_run=True)
+        monkeypatch.setattr(spec_mod, "_YamlLoader", yaml.SafeLoader)
+        assert render_spec(spec_file, dry_run=True) == expected
+
     def test_file_not_found(self):
         with pytest.raises(FileNotFoundError):
             load_spec("/nonexistent/spec.yaml")
@@ -378,6 +438,67 @@ class TestOptions:
 # ---------------------------------------------------------------------------
 
 
+class TestCaching:
+    def test_identical_defs_share_sprite(self, tmp_path: Path):
+        data = {
+            "palette": {".": "transparent", "K": "#000000"},
+            "sprites": {
+                "a": {"block": "K.\n.K", "save": "a.png"},
+                "b": {"block": "K.\n.K", "save": "b.png"},
+            },
+        }
+        spec = load_spec(_write_spec(tmp_path, data))
+        results = spec.render()
+        assert results["a"] is results["b"]
+        assert spec.render()["a"] is results["a"]
+        # The cache belongs to the Spec, not the process
+        other = load_spec(_write_spec(tmp_path, data)).render()
+        assert other["a"] == results["a"]
+        assert other["a"] is not results["a"]
+
+    def test_dependency_change_invalidates(self, tmp_path: Path):
+        data = {
+            "palette": {".": "transparent", "K": "#000000", "W": "#FFFFFF"},
+            "sprites": {
+                "f": {"block": "K."},
+                "s": {"type": "strip", "frames": ["f", "f"]},
+            },
+        }
+        spec = load_spec(_write_spec(tmp_path, data))
+        first = spec.render()["s"]
+        spec.sprite_defs["f"]["block"] = "W."
+        second = spec.render()["s"]
+        assert second.get_pixel(0, 0) == WHITE
+        assert first.get_pixel(0, 0) == BLACK
+
+    def test_palette_change_invalidates(self, tmp_path: Path):
+        data = {
+            "palette": {"K": "#000000"},
+            "sprites": {"dot": {"block": "K"}},
+        }
+        spec = load_spec(_write_spec(tmp_path, data))
+        first = spec.render()["dot"]
+        spec.palette = Palette({"K": "#FFFFFF"})
+        second = spec.render()["dot"]
+        assert first.get_pixel(0, 0) == BLACK
+        assert second.get_pixel(0, 0) == WHITE
+
+    def test_reference_chain_keys_each_def_once(self, tmp_path: Path, monkeypatch):
+        from pixeldot import spec as spec_mod
+
+        sprites = {"s0": {"block": "K."}}
+        for i in range(1, 12):
+            sprites[f"s{i}"] = {"type": "strip", "frames": [f"s{i - 1}"]}
+        data = {"palette": {".": "transparent", "K": "#000000"}, "sprites": sprites}
+        spec = load_spec(_write_spec(tmp_path, data))
+        calls = []
+        dumps = spec_mod.json.dumps
+        monkeypatch.setattr(spec_mod.json, "dumps", lambda *a, **kw: calls.append(1) or dumps(*a, **kw))
+        results = spec.render()
+        assert results["s11"].size == (2, 1)
+        assert len(calls) == len(sprites)
+
+
 class TestLayers:
     def test_layers_simple(self, tmp_path: Path):
         data = {
@@ -27,6 +27,22 @@ class TestCreation:
                 [(0, 0, 0, 255)],
             ])
 
+    def test_non_rgba_pixels(self):
+        with pytest.raises(ValueError, match="RGBA"):
+            px.Sprite([[(0, 0, 0)]])
+
+    def test_mixed_pixel_sizes(self):
+        # 3 + 5 channels add up to two RGBA pixels, but must still be rejected
+        with pytest.raises(ValueError, match="RGBA"):
+            px.Sprite([[(1, 2, 3), (4, 5, 6, 7, 8)]])
+
+    def test_buffer(self):
+        s = make_sprite(["Kr"])
+        buf = s.buffer()
+        assert buf.shape == (1, 2, 4)
+        assert buf.readonly
+        assert buf.tobytes() == bytes(px.BLACK) + bytes((255, 0, 0, 255))
+
 
 class TestTransforms:
     def test_crop(self):
@@ -44,6 +60,27 @@ class TestTransforms:
         # Original unchanged (immutable)
         assert bg.get_pixel(1, 1) == px.TRANSPARENT
 
+    def test_paste_clips_out_of_bounds(self):
+        bg = px.Sprite.empty(2, 2)
+        result = bg.paste(make_sprite(["rK", "Kr"]), -1, 1)
+        assert result.get_pixel(0, 1) == px.BLACK
+        assert result.get_pixel(1, 1) == px.TRANSPARENT
+        assert bg.paste(make_sprite(["r"]), 5, 5) == bg
+
+    def test_paste_semi_transparent(self):
+        bg = make_sprite(["K"])
+        half_red = px.Sprite([[(255, 0, 0, 128)]])
+        assert bg.paste(half_red, 0, 0).get_pixel(0, 0) == (128, 0, 0, 255)
+
+    def test_paste_pure_python_fallback(self, monkeypatch):
+        from pixeldot import sprite
+
+        bg = px.Sprite([[(10, 20, 30, a) for a in (0, 90, 254, 255)]] * 2)
+        fg = px.Sprite([[(200, 100, 50, a) for a in (255, 0, 1, 128, 254)]] * 3)
+        expected = [bg.paste(fg, x, y) for x in (-2, 0, 1) for y in (-1, 0)]
+        monkeypatch.setattr(sprite, "np", None)
+        assert [bg.paste(fg, x, y) for x in (-2, 0, 1) for y in (-1, 0)] == expected
+
     def test_flip_h(self):
         s = make_sprite(["Kr"])
         flipped = s.flip_h()
@@ -83,13 +120,32 @@ class TestBounds:
     def test_opaque_bounds_none(self):
         s = make_sprite(["...", "..."])
         assert s.opaque_bounds() is None
+        assert s.opaque_bounds() is None
+
+    def test_opaque_bounds_pure_python_fallback(self, monkeypatch):
+        from pixeldot import sprite
+
+        sprites = [make_sprite(rows) for rows in (["K.", ".."], ["...", "..r", ".K."], [".."])]
+        expected = [s._scan_bounds() for s in sprites]
+        monkeypatch.setattr(sprite, "np", None)
+        assert [s._scan_bounds() for s in sprites] == expected
+        assert expected == [(0, 0, 1, 1), (1, 1, 2, 2), None]
+
+    def test_trim(self):
+        s = make_sprite(["...", ".Kr", "..."])
+        trimmed = s.trim()
+        assert trimmed == make_sprite(["Kr"])
+        assert trimmed.opaque_bounds() == (0, 0, 2, 1)
+        assert trimmed.trim() is trimmed
 
 
 class TestEquality:
     def test_equal(self):
         a = make_sprite(["Kr"])
         b = make_sprite(["Kr"])
+        assert a is not b
         assert a == b
+        assert a == a
 
     def test_not_equal(self):
         a = make_sprite(["Kr"])
@@ -103,3 +159,10 @@ class TestImageConversion:
         img = original.to_image()
         restored = px.Sprite.from_image(img)
         assert original == restored
+
+    def test_to_image_is_independent(self):
+        original = make_sprite(["Kr", "rK"])
+        img = original.to_image()
+        img.putpixel((0, 0), (1, 2, 3, 4))
+        assert original.get_pixel(0, 0) == px.BLACK
+        assert original.to_image().getpixel((0, 0)) == px.BLACK
@@ -29,11 +29,14 @@ class TestPresetPalettes:
     def test_all_rgba_tuples(self):
         for name, palette in [
             ("gameboy", px.GAMEBOY_PALETTE),
+            ("nes", px.NES_PALETTE),
             ("pico8", px.PICO8_PALETTE),
+            ("sweetie16", px.SWEETIE16_PALETTE),
+            ("endesga32", px.ENDESGA32_PALETTE),
         ]:
             for key, color in palette.items():
                 assert len(color) == 4, f"{name}.{key} is not RGBA"
-                assert all(0 <= c <= 255 for c in color), f"{name}.{key} out of range"
+                assert 0 <= min(color) and max(color) <= 255, f"{name}.{key} out of range"
 
     def test_list_presets(self):
         names = px.list_preset_palettes()
@@ -52,6 +55,18 @@ class TestPresetPalettes:
         p = px.get_preset_palette("PICO8")
         assert isinstance(p, px.Palette)
 
+    def test_get_preset_cached(self):
+        assert px.get_preset_palette("nes") is px.get_preset_palette("NES")
+        assert px.get_preset_palette("nes") is not px.get_preset_palette("pico8")
+
+    def test_get_preset_hex_values(self, monkeypatch):
+        from pixeldot import style
+
+        monkeypatch.setitem(style._PRESET_PALETTES, "gameboy", {"red": "#FF0000", "k": [0, 0, 0, 255]})
+        p = px.get_preset_palette("gameboy")
+        assert p["0"] == (255, 0, 0, 255)
+        assert p["1"] == px.BLACK
+
     def test_unknown_preset_raises(self):
         with pytest.raises(KeyError, match="Unknown preset"):
             px.get_preset_palette("nonexistent")
@@ -95,11 +110,10 @@ class TestApplyOutline:
         result = px.apply_outline(s, style=px.OutlineStyle.THICK)
         assert result.width == 3
         assert result.height == 3
-        # All 8 neighbors should be outlined
-        for x in range(3):
-            for y in range(3):
-                if (x, y) != (1, 1):
-                    assert result.get_pixel(x, y)[3] > 0
+        # All 8 neighbors should be outlined, around the opaque original
+        alpha = bytes(result.buffer())[3::4]
+        assert 0 not in alpha
+        assert result.get_pixel(1, 1) == px.BLACK
 
     def test_outline_does_not_fill_isolated_transparent(self):
         s = make_sprite(["K..", "...", "..K"])
@@ -108,6 +122,15 @@ class TestApplyOutline:
         # Original (1,1) maps to (2,2) in expanded. Not adjacent to either pixel.
         assert result.get_pixel(2, 2) == px.TRANSPARENT
 
+    def test_pure_python_fallback(self, monkeypatch):
+        from pixeldot import style
+
+        s = make_sprite(["K.r", ".r.", "r.K"])
+        styles = [px.OutlineStyle.THIN, px.OutlineStyle.THICK, px.OutlineStyle.SELECTIVE]
+        expected = [px.apply_outline(s, (1, 2, 3, 0), st) for st in styles]
+        monkeypatch.setattr(style, "np", None)
+        assert [px.apply_outline(s, (1, 2, 3, 0), st) for st in styles] == expected
+
 
 class TestApplyShadow:
     def test_shadow_expands_size(self):
@@ -135,3 +158,12 @@ class TestApplyShadow:
         result = px.apply_shadow(s, offset=(0, 0))
         # Original should be on top of shadow
         assert result.get_pixel(0, 0) == px.BLACK
+
+    def test_pure_python_fallback(self, monkeypatch):
+        from pixeldot import style
+
+        s = make_sprite(["K.", "rK"])
+        offsets = [(1, 1), (-2, 1), (0, -3), (0, 0)]
+        expected = [px.apply_shadow(s, offset=o, opacity=0.3) for o in offsets]
+        monkeypatch.setattr(style, "np", None)
+        assert [px.apply_shadow(s, offset=o, opacity=0.3) for o in offsets] == expected
@@ -107,6 +107,31 @@ class TestTileMap:
         # bottom-left tile is rock (black)
         assert sprite.get_pixel(0, 2) == px.BLACK
 
+    def test_to_sprite_semi_transparent(self):
+        glass = px.Sprite([[(90, 200, 30, 77), (0, 0, 0, 0)], [(255, 9, 9, 254), (1, 2, 3, 255)]])
+        tm = px.TileMap(px.TileSet({'a': glass, 'b': glass.flip_v()}), ['ab', 'ba'])
+        expected = px.Sprite.empty(4, 4)
+        for gx, gy, tile in ((0, 0, glass), (2, 0, glass.flip_v()),
+                             (0, 2, glass.flip_v()), (2, 2, glass)):
+            expected = expected.paste(tile, gx, gy)
+        assert tm.to_sprite() == expected
+
+    def test_to_sprite_pure_python_fallback(self, monkeypatch):
+        from pixeldot import tiles
+
+        wide = px.Sprite([[(10, 20, 30, 255), (0, 0, 0, 0), (200, 1, 2, 128)]] * 2)
+        tileset = px.TileSet({'草': wide, 'w': wide.flip_h(), '.': px.Sprite.empty(3, 2)})
+        grid = ['草w.', '.草草', 'ww草']
+        expected = px.TileMap(tileset, grid).to_sprite()
+        assert expected.size == (9, 6)
+        assert px.TileMap(tileset, grid).to_sprite() == expected  # cached tile cells
+        monkeypatch.setattr(tiles, "np", None)
+        assert px.TileMap(tileset, grid).to_sprite() == expected
+
+    def test_to_sprite_cached(self, tileset):
+        tm = px.TileMap(tileset, ['gw', 'rg'])
+        assert tm.to_sprite() is tm.to_sprite()
+
     def test_single_tile(self, tileset):
         tm = px.TileMap(tileset, ['g'])
         sprite = tm.to_sprite()
@@ -116,6 +141,8 @@ class TestTileMap:
     def test_unknown_tile_raises(self, tileset):
         with pytest.raises(KeyError, match="not in TileSet"):
             px.TileMap(tileset, ['gx'])
+        with pytest.raises(KeyError, match=r"'草' at grid \(1, 1\)"):
+            px.TileMap(tileset, ['gw', 'g草'])
 
     def test_inconsistent_row_length_raises(self, tileset):
         with pytest.raises(ValueError, match="chars"):